@@ -1,5 +1,5 @@
-from .core import PinyinizeOptions, PinyinizeResult, pinyinize
+from .core import PinyinizeOptions, PinyinizeResult, pinyinize, pinyinize_many
 from .resources import PinyinResources
 
-__all__ = ["PinyinResources", "PinyinizeOptions", "PinyinizeResult", "pinyinize"]
+__all__ = ["PinyinResources", "PinyinizeOptions", "PinyinizeResult", "pinyinize", "pinyinize_many"]
 
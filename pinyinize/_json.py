@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+# orjson.JSONDecodeError subclasses this, so callers can catch one type for both backends.
+JSONDecodeError = json.JSONDecodeError
+
+
+def _std_dumps(obj: Any, *, indent: bool = False) -> bytes:
+    """Stdlib encoder producing the same bytes as orjson (compact, UTF-8, non-ASCII kept)."""
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _std_loads(data: str | bytes | bytearray | memoryview) -> Any:
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+# orjson is an optional dependency (`pip install orjson`); without it the stdlib encoder above
+# is used. Both backends return UTF-8 bytes from dumps and raise JSONDecodeError subclasses;
+# tests/test_json.py runs each of them.
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+if orjson is not None:
+
+    def dumps(obj: Any, *, indent: bool = False) -> bytes:
+        """Encode `obj` as UTF-8 JSON bytes; `indent` uses two-space indentation."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+
+    loads = orjson.loads
+else:  # pragma: no cover
+    dumps = _std_dumps
+    loads = _std_loads
@@ -7,6 +7,7 @@ import re
 import sys
 from pathlib import Path
 
+from . import _json
 from .core import PinyinizeOptions, pinyinize
 from .llm import OllamaLLMAdapter
 from .resources import PinyinResources
@@ -38,7 +39,7 @@ def _next_override_id(existing_rules: list[dict]) -> str:
 def _load_overrides(path: Path) -> dict:
     if not path.exists():
         return {"schema_version": 1, "rules": []}
-    return json.loads(path.read_text(encoding="utf-8"))
+    return _json.loads(path.read_bytes())
 
 
 def _write_overrides(path: Path, data: dict) -> None:
@@ -68,6 +69,21 @@ def main(argv: list[str] | None = None) -> int:
     parser.add_argument("text", nargs="?", help="Input text. If omitted, read from stdin.")
     parser.add_argument("--data-dir", default=".", help="Directory containing *.json data files.")
     parser.add_argument("--report", default=None, help="Write report JSON to this path.")
+    parser.add_argument(
+        "--compile-resources",
+        default=None,
+        metavar="PATH",
+        help="Load --data-dir, write a compiled resource file to PATH, and exit.",
+    )
+    parser.add_argument(
+        "--resources",
+        default=None,
+        metavar="PATH",
+        help=(
+            "Load resources from a --compile-resources file instead of the JSON in --data-dir "
+            "(a data-only JSON document; loading it never executes code)."
+        ),
+    )
     parser.add_argument(
         "--segmenter",
         action="append",
@@ -86,12 +102,19 @@ def main(argv: list[str] | None = None) -> int:
     parser.add_argument("--debug", action="store_true", help="Print intermediate processing steps.")
     args = parser.parse_args(argv)
 
+    data_dir = Path(args.data_dir)
+    if args.compile_resources:
+        PinyinResources.load_from_dir(data_dir).save_compiled(args.compile_resources)
+        return 0
+
     text = args.text
     if text is None:
         text = sys.stdin.read()
 
-    data_dir = Path(args.data_dir)
-    resources = PinyinResources.load_from_dir(data_dir)
+    if args.resources:
+        resources = PinyinResources.load_compiled(args.resources)
+    else:
+        resources = PinyinResources.load_from_dir(data_dir)
 
     llm_adapter = None
     double_check_adapter = None
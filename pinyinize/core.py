@@ -2,12 +2,12 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
-from typing import Any, Literal
+from typing import Any, Literal, Mapping, Sequence
 
-from .preprocess import split_spans
+from .preprocess import split_spans_batch
 from .resources import PinyinResources
-from .rules import AppliedRule, rule_matches, sort_rules
-from .types import CharDecision, Rule, SegmenterName, Span, Token
+from .rules import AppliedRule, RuleSet
+from .types import CharDecision, SegmenterName, Span, Token
 from .util import is_word_like_protected_kind, normalize_pinyin, normalize_word_pinyin
 
 
@@ -80,6 +80,8 @@ class PinyinizeOptions:
     llm_adapter: Any | None = None
     double_check_adapter: Any | None = None
     double_check_threshold: float = 0.85
+    # pinyinize_many: number of texts whose spans share one segment_and_tag request.
+    llm_batch_size: int = 8
     debug: bool = False
 
 
@@ -90,17 +92,7 @@ class PinyinizeResult:
     report: dict[str, Any]
 
 
-def _build_max_len_by_first_char(words: dict[str, str]) -> dict[str, int]:
-    out: dict[str, int] = {}
-    for w in words.keys():
-        if not w:
-            continue
-        fc = w[0]
-        out[fc] = max(out.get(fc, 0), len(w))
-    return out
-
-
-def _segment_fmm(text: str, words: dict[str, str], max_len_by_fc: dict[str, int]) -> list[str]:
+def _segment_fmm(text: str, words: Mapping[str, str], max_len_by_fc: Mapping[str, int]) -> list[str]:
     tokens: list[str] = []
     i = 0
     n = len(text)
@@ -124,8 +116,11 @@ def _segment_fmm(text: str, words: dict[str, str], max_len_by_fc: dict[str, int]
     return tokens
 
 
-def _tokens_from_spans_fallback(spans: list[Span], word_pinyin: dict[str, str]) -> list[Token]:
-    max_len_by_fc = _build_max_len_by_first_char(word_pinyin)
+def _tokens_from_spans_fallback(
+    spans: list[Span],
+    word_pinyin: Mapping[str, str],
+    max_len_by_fc: Mapping[str, int],
+) -> list[Token]:
     tokens: list[Token] = []
     for sp in spans:
         if sp.type != "han":
@@ -151,46 +146,164 @@ def _tokens_from_spans_fallback(spans: list[Span], word_pinyin: dict[str, str])
     return tokens
 
 
+def _segment_request(span_items: list[dict[str, str]]) -> dict[str, Any]:
+    return {
+        "schema_version": 1,
+        "task": "segment_and_tag",
+        "tagset": {"upos": "UDv2", "xpos": "CTB", "ner": "CoNLL"},
+        "spans": span_items,
+    }
+
+
+@dataclass(frozen=True)
+class _PrefetchedSegment:
+    # This text's share of a batched segment_and_tag response, or the exception raised for the batch.
+    response: Any
+    # The batched request that was actually sent.
+    request: dict[str, Any]
+    # Batch-level meta shared by every text of the batch: its text indices and the warnings
+    # that could not be attributed to one text.
+    batch: dict[str, Any]
+
+
+def _batch_text_index(ns_id: Any, batch: set[int]) -> tuple[int, str] | None:
+    """Split a "T<k>.<rest>" id into (k, rest) if k belongs to the batch."""
+    if not isinstance(ns_id, str):
+        return None
+    prefix, dot, rest = ns_id.partition(".")
+    k_str = prefix[1:] if prefix.startswith("T") else ""
+    if not dot or not k_str.isdigit() or int(k_str) not in batch:
+        return None
+    return int(k_str), rest
+
+
+def _prefetch_llm_segmentation(
+    spans_per_text: list[list[Span]],
+    llm_adapter: Any,
+    batch_size: int,
+) -> list[_PrefetchedSegment | None] | None:
+    """
+    Segment the han spans of many texts with one segment_and_tag call per batch.
+    Span ids are namespaced as "T<k>.<span_id>" in the batched request and mapped back,
+    so each text gets a response shaped like its own single-text call (or the exception
+    raised for its batch). Warnings are split the same way: string warnings prefixed with
+    "T<k>." and dict warnings whose span_id is namespaced go to text k; the rest stay on
+    the batch. Returns None if the adapter cannot segment.
+    """
+    segment_fn = getattr(llm_adapter, "segment_and_tag", None)
+    if not callable(segment_fn):
+        return None
+
+    out: list[_PrefetchedSegment | None] = [None] * len(spans_per_text)
+    pending = [k for k, spans in enumerate(spans_per_text) if any(sp.type == "han" for sp in spans)]
+    for b in range(0, len(pending), batch_size):
+        batch = pending[b : b + batch_size]
+        request = _segment_request(
+            [
+                {"span_id": f"T{k}.{sp.span_id}", "text": sp.text}
+                for k in batch
+                for sp in spans_per_text[k]
+                if sp.type == "han"
+            ]
+        )
+        batch_meta: dict[str, Any] = {"texts": list(batch), "warnings": []}
+        try:
+            response = segment_fn(request)
+        except Exception as e:  # noqa: BLE001
+            for k in batch:
+                out[k] = _PrefetchedSegment(e, request, batch_meta)
+            continue
+
+        resp_spans = response.get("spans") if isinstance(response, dict) else None
+        if not isinstance(resp_spans, list):
+            # Let each text report the malformed response itself.
+            for k in batch:
+                out[k] = _PrefetchedSegment(response, request, batch_meta)
+            continue
+
+        members = set(batch)
+        split: dict[int, list[dict[str, Any]]] = {k: [] for k in batch}
+        for s in resp_spans:
+            if not isinstance(s, dict):
+                continue
+            hit = _batch_text_index(s.get("span_id"), members)
+            if hit is not None:
+                split[hit[0]].append({**s, "span_id": hit[1]})
+
+        split_warnings: dict[int, list[Any]] = {k: [] for k in batch}
+        raw_warnings = response.get("warnings", [])
+        for w in raw_warnings if isinstance(raw_warnings, list) else [raw_warnings]:
+            if isinstance(w, dict):
+                hit = _batch_text_index(w.get("span_id"), members)
+                if hit is not None:
+                    split_warnings[hit[0]].append({**w, "span_id": hit[1]})
+                    continue
+            else:
+                hit = _batch_text_index(w, members)
+                if hit is not None:
+                    split_warnings[hit[0]].append(hit[1])
+                    continue
+            batch_meta["warnings"].append(w)
+
+        for k in batch:
+            share = {"spans": split[k], "warnings": split_warnings[k]}
+            out[k] = _PrefetchedSegment(share, request, batch_meta)
+    return out
+
+
+_NOT_PREFETCHED = object()
+
+
 def _tokens_from_spans_llm_or_fallback(
     spans: list[Span],
-    word_pinyin: dict[str, str],
+    word_pinyin: Mapping[str, str],
+    max_len_by_fc: Mapping[str, int],
     llm_adapter: Any | None,
+    *,
+    prefetched: Any = _NOT_PREFETCHED,
 ) -> tuple[list[Token], dict[str, Any]]:
     """
     Returns (tokens, llm_meta).
     llm_meta contains request/response/error/invalid span ids for reporting.
+    `prefetched` carries this text's share of a batched segment_and_tag call.
     """
     han_spans = [sp for sp in spans if sp.type == "han"]
     if not llm_adapter or not han_spans:
-        return _tokens_from_spans_fallback(spans, word_pinyin), {"used": False}
+        return _tokens_from_spans_fallback(spans, word_pinyin, max_len_by_fc), {"used": False}
 
-    request = {
-        "schema_version": 1,
-        "task": "segment_and_tag",
-        "tagset": {"upos": "UDv2", "xpos": "CTB", "ner": "CoNLL"},
-        "spans": [{"span_id": sp.span_id, "text": sp.text} for sp in han_spans],
-    }
+    request = _segment_request([{"span_id": sp.span_id, "text": sp.text} for sp in han_spans])
     meta: dict[str, Any] = {"used": True, "request": request}
 
-    try:
-        segment_fn = getattr(llm_adapter, "segment_and_tag", None)
-        if not callable(segment_fn):
-            meta["error"] = "llm_adapter_missing_segment_and_tag"
-            return _tokens_from_spans_fallback(spans, word_pinyin), meta
-        response = segment_fn(request)
-    except Exception as e:  # noqa: BLE001
-        meta["error"] = f"llm_segment_and_tag_exception:{e}"
-        return _tokens_from_spans_fallback(spans, word_pinyin), meta
+    def fast_fallback(error: str) -> tuple[list[Token], dict[str, Any]]:
+        # Response-level failure: skip per-span validation and segment every span deterministically.
+        meta["error"] = error
+        meta["fallback_fast_path"] = True
+        return _tokens_from_spans_fallback(spans, word_pinyin, max_len_by_fc), meta
+
+    if prefetched is not _NOT_PREFETCHED:
+        # Report the batched request that was actually sent, not a per-text reconstruction.
+        meta["batched"] = True
+        meta["request"] = prefetched.request
+        meta["batch"] = prefetched.batch
+        response = prefetched.response
+        if isinstance(response, Exception):
+            return fast_fallback(f"llm_segment_and_tag_exception:{response}")
+    else:
+        try:
+            segment_fn = getattr(llm_adapter, "segment_and_tag", None)
+            if not callable(segment_fn):
+                return fast_fallback("llm_adapter_missing_segment_and_tag")
+            response = segment_fn(request)
+        except Exception as e:  # noqa: BLE001
+            return fast_fallback(f"llm_segment_and_tag_exception:{e}")
 
     meta["response"] = response
     if not isinstance(response, dict):
-        meta["error"] = "llm_response_not_object"
-        return _tokens_from_spans_fallback(spans, word_pinyin), meta
+        return fast_fallback("llm_response_not_object")
 
     resp_spans = response.get("spans")
     if not isinstance(resp_spans, list):
-        meta["error"] = "llm_response_missing_spans"
-        return _tokens_from_spans_fallback(spans, word_pinyin), meta
+        return fast_fallback("llm_response_missing_spans")
 
     # Build span_id -> original Span lookup for validation
     span_by_id: dict[str, Span] = {sp.span_id: sp for sp in han_spans}
@@ -205,7 +318,13 @@ def _tokens_from_spans_llm_or_fallback(
         if isinstance(sid, str) and isinstance(toks, list):
             by_span_id[sid] = [t for t in toks if isinstance(t, dict)]
 
-    max_len_by_fc = _build_max_len_by_first_char(word_pinyin)
+    if not by_span_id:
+        # No usable span in the response, so every span would fail validation below.
+        meta["invalid_spans"] = [sp.span_id for sp in han_spans]
+        meta["warnings"] = response.get("warnings", [])
+        meta["fallback_fast_path"] = True
+        return _tokens_from_spans_fallback(spans, word_pinyin, max_len_by_fc), meta
+
     invalid_spans: list[str] = []
     tokens: list[Token] = []
 
@@ -374,7 +493,8 @@ def _tokens_from_spans_llm_or_fallback(
 
 def _tokens_from_spans_jieba_or_fallback(
     spans: list[Span],
-    word_pinyin: dict[str, str],
+    word_pinyin: Mapping[str, str],
+    max_len_by_fc: Mapping[str, int],
 ) -> tuple[list[Token], dict[str, Any]]:
     """
     Returns (tokens, meta).
@@ -389,12 +509,11 @@ def _tokens_from_spans_jieba_or_fallback(
         import jieba.posseg as _pseg  # type: ignore[import-not-found]
     except Exception as e:  # noqa: BLE001
         meta["error"] = f"jieba_import_error:{e}"
-        return _tokens_from_spans_fallback(spans, word_pinyin), meta
+        return _tokens_from_spans_fallback(spans, word_pinyin, max_len_by_fc), meta
 
     meta["used"] = True
     invalid_spans: list[str] = []
     tokens: list[Token] = []
-    max_len_by_fc = _build_max_len_by_first_char(word_pinyin)
 
     def fallback_for_span(sp: Span) -> None:
         seg = _segment_fmm(sp.text, word_pinyin, max_len_by_fc)
@@ -466,7 +585,7 @@ def _tokens_from_spans_jieba_or_fallback(
     return tokens, meta
 
 
-def _char_candidates(char_base: dict[str, list[str]], ch: str) -> list[str]:
+def _char_candidates(char_base: dict[str, tuple[str, ...]], ch: str) -> list[str]:
     cands = char_base.get(ch)
     return list(cands) if cands else []
 
@@ -536,7 +655,7 @@ def _polyphone_pick(
 
 def _analyze_token(
     tok: Token,
-    word_pinyin: dict[str, str],
+    word_pinyin: Mapping[str, str],
     resources: PinyinResources,
 ) -> tuple[str, list[CharDecision], list[str]]:
     warnings: list[str] = []
@@ -627,22 +746,27 @@ def _analyze_token(
 def _apply_overrides(
     tokens: list[Token],
     token_decisions: dict[tuple[int, int], list[CharDecision]],
-    overrides_rules: list[dict[str, Any]],
+    rule_set: RuleSet,
 ) -> tuple[list[AppliedRule], list[dict[str, Any]]]:
     applied: list[AppliedRule] = []
     conflicts: list[dict[str, Any]] = []
 
-    parsed_rules: list[Rule] = []
-    for r in overrides_rules:
-        if isinstance(r, dict) and isinstance(r.get("id"), str):
-            parsed_rules.append(r)  # type: ignore[arg-type]
-
     # Only consider prev/next within the same han span.
     span_to_tokens: dict[str, list[Token]] = {}
     for tok in tokens:
         span_to_tokens.setdefault(tok.span_id, []).append(tok)
 
-    for rule in sort_rules(parsed_rules):
+    # Rules keyed on a literal token text can only match where that text occurs in a span;
+    # skip the per-window scan for the rest.
+    span_texts = ["".join(t.text for t in span_tokens) for span_tokens in span_to_tokens.values()]
+    live_ids = {id(r) for r in rule_set.residual}
+    for text, keyed_rules in rule_set.by_text.items():
+        if any(text in span_text for span_text in span_texts):
+            live_ids.update(id(r) for r in keyed_rules)
+
+    for rule, matcher in zip(rule_set.ordered, rule_set.matchers):
+        if id(rule) not in live_ids:
+            continue
         target = rule.get("target")
         choose = rule.get("choose")
         rid = rule.get("id")
@@ -657,46 +781,56 @@ def _apply_overrides(
         match = rule.get("match") or {}
         self_part = match.get("self") if isinstance(match, dict) else None
         self_text = self_part.get("text") if isinstance(self_part, dict) else None
-        self_text_len = len(self_text) if isinstance(self_text, str) else None
-
-        for span_tokens in span_to_tokens.values():
-            for i in range(len(span_tokens)):
-                # If rule specifies an exact self.text, allow it to match across multiple tokens
-                # by creating a virtual "window token" over consecutive tokens whose concatenated
-                # text length equals len(self.text).
-                if isinstance(self_text_len, int) and self_text_len > 0:
+
+        windowed = isinstance(self_text, str) and len(self_text) > 0
+        for span_tokens, span_text in zip(span_to_tokens.values(), span_texts):
+            if target_char not in span_text or (windowed and self_text not in span_text):
+                continue
+            if windowed:
+                starts: Sequence[int] = range(len(span_tokens))
+            else:
+                # Single-token windows: evaluate self/prev/next over the whole span at once.
+                starts = [
+                    i
+                    for i, ok in enumerate(matcher.match_batch(span_tokens))
+                    if ok and target_char in span_tokens[i].text
+                ]
+            for i in starts:
+                if windowed:
+                    # The rule specifies an exact self.text, so allow it to match across multiple
+                    # tokens by creating a virtual "window token" over consecutive tokens whose
+                    # concatenated text equals self.text.
+                    if not self_text.startswith(span_tokens[i].text):
+                        continue
                     window_tokens: list[Token] = []
                     total_len = 0
                     j = i
-                    while j < len(span_tokens) and total_len < self_text_len:
+                    while j < len(span_tokens) and total_len < len(self_text):
                         window_tokens.append(span_tokens[j])
                         total_len += len(span_tokens[j].text)
                         j += 1
-                    if total_len != self_text_len:
+                    window_text = "".join(t.text for t in window_tokens)
+                    if window_text != self_text or target_char not in window_text:
                         continue
-                else:
-                    window_tokens = [span_tokens[i]]
-                    j = i + 1
-
-                window_text = "".join(t.text for t in window_tokens)
-                if target_char not in window_text:
-                    continue
-
-                window_tok = Token(
-                    span_id=window_tokens[0].span_id,
-                    index_in_span=window_tokens[0].index_in_span,
-                    start=window_tokens[0].start,
-                    end=window_tokens[-1].end,
-                    text=window_text,
-                    upos=window_tokens[0].upos,
-                    xpos=window_tokens[0].xpos,
-                    ner=window_tokens[0].ner,
-                )
 
-                prev_tok = span_tokens[i - 1] if i > 0 else None
-                next_tok = span_tokens[j] if j < len(span_tokens) else None
-                if not rule_matches(rule, window_tok, prev_tok, next_tok):
-                    continue
+                    window_tok = Token(
+                        span_id=window_tokens[0].span_id,
+                        index_in_span=window_tokens[0].index_in_span,
+                        start=window_tokens[0].start,
+                        end=window_tokens[-1].end,
+                        text=window_text,
+                        upos=window_tokens[0].upos,
+                        xpos=window_tokens[0].xpos,
+                        ner=window_tokens[0].ner,
+                    )
+                    prev_tok = span_tokens[i - 1] if i > 0 else None
+                    next_tok = span_tokens[j] if j < len(span_tokens) else None
+                    if not matcher.matches(window_tok, prev_tok, next_tok):
+                        continue
+                else:
+                    window_tok = span_tokens[i]
+                    window_tokens = [window_tok]
+                    window_text = window_tok.text
 
                 occ_offsets = [k for k, ch in enumerate(window_text) if ch == target_char]
                 if not occ_offsets:
@@ -957,7 +1091,9 @@ def _pinyinize_single(
     *,
     segmenter: SegmenterName,
     spans: list[Span],
-    combined_word_pinyin: dict[str, str],
+    combined_word_pinyin: Mapping[str, str],
+    max_len_by_fc: Mapping[str, int],
+    llm_prefetched: Any = _NOT_PREFETCHED,
 ) -> PinyinizeResult:
     import sys
 
@@ -976,11 +1112,15 @@ def _pinyinize_single(
 
     llm_segment_meta: dict[str, Any] = {"used": False}
     if segmenter == "greedy":
-        tokens = _tokens_from_spans_fallback(spans, combined_word_pinyin)
+        tokens = _tokens_from_spans_fallback(spans, combined_word_pinyin, max_len_by_fc)
         segment_meta: dict[str, Any] = {"segmenter": "greedy", "used": True}
     elif segmenter == "ollama":
         tokens, llm_segment_meta = _tokens_from_spans_llm_or_fallback(
-            spans, combined_word_pinyin, options.llm_adapter
+            spans,
+            combined_word_pinyin,
+            max_len_by_fc,
+            options.llm_adapter,
+            prefetched=llm_prefetched,
         )
         segment_meta = dict(llm_segment_meta)
         segment_meta.setdefault("segmenter", "ollama")
@@ -989,10 +1129,12 @@ def _pinyinize_single(
             segment_meta.setdefault("error", "llm_adapter_not_provided")
             llm_segment_meta.setdefault("error", "llm_adapter_not_provided")
     elif segmenter == "jieba":
-        tokens, segment_meta = _tokens_from_spans_jieba_or_fallback(spans, combined_word_pinyin)
+        tokens, segment_meta = _tokens_from_spans_jieba_or_fallback(
+            spans, combined_word_pinyin, max_len_by_fc
+        )
         segment_meta.setdefault("segmenter", "jieba")
     else:
-        tokens = _tokens_from_spans_fallback(spans, combined_word_pinyin)
+        tokens = _tokens_from_spans_fallback(spans, combined_word_pinyin, max_len_by_fc)
         segment_meta = {
             "segmenter": "greedy",
             "used": True,
@@ -1056,7 +1198,7 @@ def _pinyinize_single(
 
     _debug_step("Step 3: Token Analysis", debug_token_analysis)
 
-    applied_rules, conflicts = _apply_overrides(tokens, token_decisions, resources.overrides_rules)
+    applied_rules, conflicts = _apply_overrides(tokens, token_decisions, resources.rule_set())
     _debug_step(
         "Step 4: Apply Overrides",
         {
@@ -1214,36 +1356,7 @@ def _pinyinize_single(
     return PinyinizeResult(segmenter=segmenter, output_text=output_text, report=report)
 
 
-def pinyinize(text: str, options: PinyinizeOptions) -> list[PinyinizeResult]:
-    import sys
-
-    spans = split_spans(text)
-    if options.debug:
-        print(f"\n{'='*60}", file=sys.stderr)
-        print("[DEBUG] preprocessing | Split spans", file=sys.stderr)
-        print(f"{'='*60}", file=sys.stderr)
-        print(
-            json.dumps(
-                [
-                    {
-                        "span_id": sp.span_id,
-                        "type": sp.type,
-                        "kind": sp.kind,
-                        "start": sp.start,
-                        "end": sp.end,
-                        "text": sp.text,
-                    }
-                    for sp in spans
-                ],
-                ensure_ascii=False,
-                indent=2,
-            ),
-            file=sys.stderr,
-        )
-
-    resources = options.resources
-    combined_word_pinyin = resources.combined_word_pinyin()
-
+def _resolve_segmenters(options: PinyinizeOptions) -> list[SegmenterName]:
     if options.segmenters is None:
         segmenters: list[SegmenterName] = ["ollama"] if options.llm_adapter else ["greedy"]
     else:
@@ -1260,14 +1373,79 @@ def pinyinize(text: str, options: PinyinizeOptions) -> list[PinyinizeResult]:
 
     if not segmenters2:
         segmenters2 = ["ollama"] if options.llm_adapter else ["greedy"]
+    return segmenters2
+
+
+def _debug_spans(spans: list[Span]) -> None:
+    import sys
+
+    print(f"\n{'='*60}", file=sys.stderr)
+    print("[DEBUG] preprocessing | Split spans", file=sys.stderr)
+    print(f"{'='*60}", file=sys.stderr)
+    print(
+        json.dumps(
+            [
+                {
+                    "span_id": sp.span_id,
+                    "type": sp.type,
+                    "kind": sp.kind,
+                    "start": sp.start,
+                    "end": sp.end,
+                    "text": sp.text,
+                }
+                for sp in spans
+            ],
+            ensure_ascii=False,
+            indent=2,
+        ),
+        file=sys.stderr,
+    )
+
 
-    return [
-        _pinyinize_single(
-            text,
-            options,
-            segmenter=seg,
-            spans=spans,
-            combined_word_pinyin=combined_word_pinyin,
+def pinyinize(text: str, options: PinyinizeOptions) -> list[PinyinizeResult]:
+    return pinyinize_many([text], options)[0]
+
+
+def pinyinize_many(texts: Sequence[str], options: PinyinizeOptions) -> list[list[PinyinizeResult]]:
+    """
+    Batch variant of `pinyinize`: returns one result list per input text.
+    The segmenter plan is resolved once per batch; the word tables are memoized on the
+    resources, so separate calls (including single-text `pinyinize`) share them too.
+    """
+    resources = options.resources
+    combined_word_pinyin = resources.combined_word_pinyin()
+    max_len_by_fc = resources.max_len_by_first_char()
+    segmenters = _resolve_segmenters(options)
+
+    spans_per_text = split_spans_batch(texts)
+
+    prefetched: list[Any] | None = None
+    if (
+        "ollama" in segmenters
+        and options.llm_adapter
+        and len(texts) > 1
+        and options.llm_batch_size > 1
+    ):
+        prefetched = _prefetch_llm_segmentation(
+            spans_per_text, options.llm_adapter, options.llm_batch_size
         )
-        for seg in segmenters2
-    ]
+
+    out: list[list[PinyinizeResult]] = []
+    for k, (text, spans) in enumerate(zip(texts, spans_per_text)):
+        if options.debug:
+            _debug_spans(spans)
+        out.append(
+            [
+                _pinyinize_single(
+                    text,
+                    options,
+                    segmenter=seg,
+                    spans=spans,
+                    combined_word_pinyin=combined_word_pinyin,
+                    max_len_by_fc=max_len_by_fc,
+                    llm_prefetched=prefetched[k] if prefetched is not None else _NOT_PREFETCHED,
+                )
+                for seg in segmenters
+            ]
+        )
+    return out
@@ -1,18 +1,49 @@
 from __future__ import annotations
 
+import http.client
 import json
 import re
+import threading
 import urllib.error
+import urllib.parse
 import urllib.request
-from dataclasses import dataclass
-from typing import Any
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Iterator
+
+from . import _json
+
+
+class LLMErrorCode(str, Enum):
+    EMPTY_RESPONSE = "empty_llm_response"
+    NO_JSON_OBJECT = "no_json_object_found"
+    INVALID_JSON_SNIPPET = "invalid_json_snippet"
+    RESPONSE_NOT_OBJECT = "llm_response_not_object"
+    HTTP_ERROR = "ollama_http_error"
+    MISSING_MESSAGE = "ollama_missing_message"
+    MISSING_CONTENT = "ollama_missing_content"
+    STREAM_INCOMPLETE = "ollama_stream_incomplete"
 
 
 class LLMError(RuntimeError):
-    pass
+    """
+    LLM call failure identified by `code`.
+    `detail` is formatted only when the error is rendered ("code" or "code:detail").
+    """
+
+    def __init__(self, code: LLMErrorCode, detail: object = "") -> None:
+        super().__init__(code, detail)
+        self.code = code
+        self.detail = detail
+
+    def __str__(self) -> str:
+        detail = str(self.detail)
+        return f"{self.code.value}:{detail}" if detail else self.code.value
 
 
 _CODE_FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$", re.IGNORECASE)
+_FENCED_OBJECT_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.IGNORECASE | re.DOTALL)
+_JSON_DECODER = json.JSONDecoder()
 
 
 def extract_json_object(text: str) -> Any:
@@ -22,44 +53,254 @@ def extract_json_object(text: str) -> Any:
     """
     t = text.strip()
     if not t:
-        raise LLMError("empty_llm_response")
+        raise LLMError(LLMErrorCode.EMPTY_RESPONSE)
 
     # Remove common ```json fences.
     if "```" in t:
-        t = _CODE_FENCE_RE.sub("", t).strip()
+        m = _FENCED_OBJECT_RE.search(t)
+        t = m.group(1) if m else _CODE_FENCE_RE.sub("", t).strip()
 
     # Try direct JSON first.
     try:
-        return json.loads(t)
-    except json.JSONDecodeError:
+        return _json.loads(t)
+    except _json.JSONDecodeError:
         pass
 
-    # Try to extract the outermost JSON object.
+    # Decode the first JSON object in place; raw_decode stops at its closing brace.
     start = t.find("{")
-    end = t.rfind("}")
-    if start != -1 and end != -1 and end > start:
-        snippet = t[start : end + 1]
+    if start == -1 or t.rfind("}") < start:
+        raise LLMError(LLMErrorCode.NO_JSON_OBJECT)
+    try:
+        obj, _end = _JSON_DECODER.raw_decode(t, start)
+    except json.JSONDecodeError as e:
+        raise LLMError(LLMErrorCode.INVALID_JSON_SNIPPET, e) from e
+    return obj
+
+
+_JSON_HEADERS = {"Content-Type": "application/json; charset=utf-8"}
+
+
+class _ConnectionPool:
+    """
+    Keep-alive HTTP(S) connections to a single host.
+    Idle connections are reused across requests so back-to-back calls skip the TCP/TLS handshake.
+    """
+
+    def __init__(self, base_url: str, *, maxsize: int = 4) -> None:
+        parts = urllib.parse.urlsplit(base_url)
+        self._conn_cls = (
+            http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        )
+        self._netloc = parts.netloc
+        self._maxsize = maxsize
+        self._idle: list[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+
+    def _acquire(self, timeout_s: float) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            if self._idle:
+                conn = self._idle.pop()
+                conn.timeout = timeout_s
+                return conn, True
+        return self._conn_cls(self._netloc, timeout=timeout_s), False
+
+    def _release(self, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            if len(self._idle) < self._maxsize:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def _finish(self, conn: http.client.HTTPConnection, resp: http.client.HTTPResponse) -> None:
+        # http.client will not send the next request until the previous response is closed.
+        resp.close()
+        if resp.will_close:
+            conn.close()
+        else:
+            self._release(conn)
+
+    def _open(
+        self, url: str, body: bytes, *, timeout_s: float
+    ) -> tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+        parts = urllib.parse.urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        while True:
+            conn, reused = self._acquire(timeout_s)
+            stale = False
+            try:
+                try:
+                    conn.request("POST", path, body=body, headers=_JSON_HEADERS)
+                except (BrokenPipeError, ConnectionResetError):
+                    stale = True
+                    raise
+                try:
+                    resp = conn.getresponse()
+                except http.client.RemoteDisconnected:
+                    # Closed before a single response byte arrived.
+                    stale = True
+                    raise
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()
+                if reused and stale:
+                    # The server dropped an idle keep-alive connection before reading the request;
+                    # retry on a fresh one. Anything else (e.g. a timeout) may mean the request was
+                    # processed, so it is not re-sent.
+                    continue
+                raise LLMError(LLMErrorCode.HTTP_ERROR, e) from e
+            if resp.status >= 400:
+                resp.read()
+                self._finish(conn, resp)
+                raise LLMError(
+                    LLMErrorCode.HTTP_ERROR, f"HTTP Error {resp.status}: {resp.reason}"
+                )
+            return conn, resp
+
+    def post(self, url: str, body: bytes, *, timeout_s: float) -> bytes:
+        conn, resp = self._open(url, body, timeout_s=timeout_s)
+        try:
+            data = resp.read()
+        except (OSError, http.client.HTTPException) as e:
+            conn.close()
+            raise LLMError(LLMErrorCode.HTTP_ERROR, e) from e
+        self._finish(conn, resp)
+        return data
+
+    def post_lines(self, url: str, body: bytes, *, timeout_s: float) -> Iterator[bytes]:
+        """POST and yield the response body line by line as it arrives."""
+        conn, resp = self._open(url, body, timeout_s=timeout_s)
+        done = False
         try:
-            return json.loads(snippet)
-        except json.JSONDecodeError as e:
-            raise LLMError(f"invalid_json_snippet:{e}") from e
+            while line := resp.readline():
+                yield line
+            done = True
+        except (OSError, http.client.HTTPException) as e:
+            raise LLMError(LLMErrorCode.HTTP_ERROR, e) from e
+        finally:
+            # A partially read response cannot be reused.
+            if done:
+                self._finish(conn, resp)
+            else:
+                conn.close()
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
 
-    raise LLMError("no_json_object_found")
+
+def _http_post_json(
+    url: str,
+    body: bytes,
+    *,
+    timeout_s: float,
+    pool: _ConnectionPool | None = None,
+) -> dict[str, Any]:
+    if pool is not None:
+        return _json.loads(pool.post(url, body, timeout_s=timeout_s))
+    req = urllib.request.Request(
+        url,
+        data=body,
+        headers=_JSON_HEADERS,
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(req, timeout=timeout_s) as resp:
+            return _json.loads(resp.read())
+    except urllib.error.URLError as e:
+        raise LLMError(LLMErrorCode.HTTP_ERROR, e) from e
 
 
-def _http_post_json(url: str, payload: dict[str, Any], *, timeout_s: float) -> dict[str, Any]:
-    data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+def _http_post_json_stream(
+    url: str,
+    body: bytes,
+    *,
+    timeout_s: float,
+    pool: _ConnectionPool | None = None,
+) -> Iterator[dict[str, Any]]:
+    """POST a streaming request and yield each NDJSON object as its line arrives."""
+    if pool is not None:
+        for line in pool.post_lines(url, body, timeout_s=timeout_s):
+            if line.strip():
+                yield _json.loads(line)
+        return
     req = urllib.request.Request(
         url,
-        data=data,
-        headers={"Content-Type": "application/json; charset=utf-8"},
+        data=body,
+        headers=_JSON_HEADERS,
         method="POST",
     )
     try:
         with urllib.request.urlopen(req, timeout=timeout_s) as resp:
-            return json.load(resp)
+            for line in resp:
+                if line.strip():
+                    yield _json.loads(line)
     except urllib.error.URLError as e:
-        raise LLMError(f"ollama_http_error:{e}") from e
+        raise LLMError(LLMErrorCode.HTTP_ERROR, e) from e
+
+
+_SEGMENT_SYSTEM_PROMPT = (
+    "You are a Chinese NLP tagger.\n"
+    "Task: segment each span text into tokens and tag each token with:\n"
+    "- upos: UDv2 UPOS tag (ADJ, ADP, ADV, AUX, CCONJ, DET, INTJ, NOUN, NUM, PART, PRON, PROPN, PUNCT, SCONJ, SYM, VERB, X)\n"
+    "- xpos: CTB tag (string, e.g., NN, VV, AD, etc.)\n"
+    "- ner: CoNLL NER tag (O, PER, LOC, ORG, MISC)\n\n"
+    "Output format:\n"
+    '{\n'
+    '  "spans": [\n'
+    '    {\n'
+    '      "span_id": "S0",\n'
+    '      "tokens": [\n'
+    '        {"text": "token1", "upos": "VERB", "xpos": "VV", "ner": "O"},\n'
+    '        {"text": "token2", "upos": "NOUN", "xpos": "NN", "ner": "O"}\n'
+    '      ]\n'
+    '    }\n'
+    '  ]\n'
+    '}\n\n'
+    "Rules:\n"
+    "1. You MUST output STRICT JSON only. No extra text.\n"
+    "2. For each span: concatenation of token.text MUST equal the original span.text exactly.\n"
+    "3. Each token must have text, upos, xpos, and ner fields."
+)
+
+_DOUBLE_CHECK_SYSTEM_PROMPT = (
+    "You are helping to disambiguate Chinese polyphonic characters.\n"
+    "Given input text, spans, tokens (with POS/NER), and a list of review items,\n"
+    "return STRICT JSON only with recommended pinyin (tone marks) for each item.\n"
+    "If context is insufficient or ambiguous, set needs_user=true for that item.\n"
+    "No extra text."
+)
+
+
+def _message_content(raw: dict[str, Any]) -> str:
+    msg = raw.get("message")
+    if not isinstance(msg, dict):
+        raise LLMError(LLMErrorCode.MISSING_MESSAGE)
+    content = msg.get("content")
+    if not isinstance(content, str):
+        raise LLMError(LLMErrorCode.MISSING_CONTENT)
+    return content
+
+
+# Tail of the /api/chat body after the user message content.
+_ENVELOPE_TAIL = b"}]}"
+
+
+def _envelope_head(model: str, system: str, *, stream: bool = False) -> bytes:
+    """Serialized /api/chat body up to (not including) the user message content."""
+    body = _json.dumps(
+        {
+            "model": model,
+            "stream": stream,
+            "messages": [
+                {"role": "system", "content": system},
+                {"role": "user", "content": ""},
+            ],
+        }
+    )
+    return body[: body.rindex(b'""')]
 
 
 @dataclass(frozen=True)
@@ -67,67 +308,60 @@ class OllamaLLMAdapter:
     model: str
     host: str = "http://localhost:11434"
     timeout_s: float = 60.0
+    # Ask Ollama for NDJSON chunks and read them as they arrive.
+    stream: bool = False
+    _pool: _ConnectionPool = field(init=False, repr=False, compare=False)
+    _segment_head: bytes = field(init=False, repr=False, compare=False)
+    _double_check_head: bytes = field(init=False, repr=False, compare=False)
 
-    def _chat(self, *, system: str, user: str) -> str:
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_pool", _ConnectionPool(self.host))
+        object.__setattr__(
+            self,
+            "_segment_head",
+            _envelope_head(self.model, _SEGMENT_SYSTEM_PROMPT, stream=self.stream),
+        )
+        object.__setattr__(
+            self,
+            "_double_check_head",
+            _envelope_head(self.model, _DOUBLE_CHECK_SYSTEM_PROMPT, stream=self.stream),
+        )
+
+    def close(self) -> None:
+        """Close idle pooled connections."""
+        self._pool.close()
+
+    def _chat(self, *, head: bytes, user: str) -> str:
         url = f"{self.host.rstrip('/')}/api/chat"
-        payload: dict[str, Any] = {
-            "model": self.model,
-            "stream": False,
-            "messages": [
-                {"role": "system", "content": system},
-                {"role": "user", "content": user},
-            ],
-        }
-        raw = _http_post_json(url, payload, timeout_s=self.timeout_s)
-        msg = raw.get("message")
-        if not isinstance(msg, dict):
-            raise LLMError("ollama_missing_message")
-        content = msg.get("content")
-        if not isinstance(content, str):
-            raise LLMError("ollama_missing_content")
-        return content
-
-    def _complete_json(self, *, system: str, payload: dict[str, Any]) -> dict[str, Any]:
-        user = json.dumps(payload, ensure_ascii=False, indent=2)
-        content = self._chat(system=system, user=user)
+        body = b"".join((head, _json.dumps(user), _ENVELOPE_TAIL))
+        if self.stream:
+            return self._chat_stream(url, body)
+        raw = _http_post_json(url, body, timeout_s=self.timeout_s, pool=self._pool)
+        return _message_content(raw)
+
+    def _chat_stream(self, url: str, body: bytes) -> str:
+        parts: list[str] = []
+        done = False
+        # Read to the end of the stream (Ollama closes it after "done") so the connection is reusable.
+        for chunk in _http_post_json_stream(url, body, timeout_s=self.timeout_s, pool=self._pool):
+            if not done:
+                parts.append(_message_content(chunk))
+                done = bool(chunk.get("done"))
+        if not done:
+            raise LLMError(LLMErrorCode.STREAM_INCOMPLETE)
+        return "".join(parts)
+
+    def _complete_json(self, *, head: bytes, payload: dict[str, Any]) -> dict[str, Any]:
+        user = _json.dumps(payload, indent=True).decode("utf-8")
+        content = self._chat(head=head, user=user)
         obj = extract_json_object(content)
         if not isinstance(obj, dict):
-            raise LLMError("llm_response_not_object")
+            raise LLMError(LLMErrorCode.RESPONSE_NOT_OBJECT)
         return obj
 
     def segment_and_tag(self, payload: dict[str, Any]) -> dict[str, Any]:
-        system = (
-            "You are a Chinese NLP tagger.\n"
-            "Task: segment each span text into tokens and tag each token with:\n"
-            "- upos: UDv2 UPOS tag (ADJ, ADP, ADV, AUX, CCONJ, DET, INTJ, NOUN, NUM, PART, PRON, PROPN, PUNCT, SCONJ, SYM, VERB, X)\n"
-            "- xpos: CTB tag (string, e.g., NN, VV, AD, etc.)\n"
-            "- ner: CoNLL NER tag (O, PER, LOC, ORG, MISC)\n\n"
-            "Output format:\n"
-            '{\n'
-            '  "spans": [\n'
-            '    {\n'
-            '      "span_id": "S0",\n'
-            '      "tokens": [\n'
-            '        {"text": "token1", "upos": "VERB", "xpos": "VV", "ner": "O"},\n'
-            '        {"text": "token2", "upos": "NOUN", "xpos": "NN", "ner": "O"}\n'
-            '      ]\n'
-            '    }\n'
-            '  ]\n'
-            '}\n\n'
-            "Rules:\n"
-            "1. You MUST output STRICT JSON only. No extra text.\n"
-            "2. For each span: concatenation of token.text MUST equal the original span.text exactly.\n"
-            "3. Each token must have text, upos, xpos, and ner fields."
-        )
-        return self._complete_json(system=system, payload=payload)
+        return self._complete_json(head=self._segment_head, payload=payload)
 
     def double_check(self, payload: dict[str, Any]) -> dict[str, Any]:
-        system = (
-            "You are helping to disambiguate Chinese polyphonic characters.\n"
-            "Given input text, spans, tokens (with POS/NER), and a list of review items,\n"
-            "return STRICT JSON only with recommended pinyin (tone marks) for each item.\n"
-            "If context is insufficient or ambiguous, set needs_user=true for that item.\n"
-            "No extra text."
-        )
-        return self._complete_json(system=system, payload=payload)
+        return self._complete_json(head=self._double_check_head, payload=payload)
 
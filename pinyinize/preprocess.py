@@ -1,92 +1,146 @@
 from __future__ import annotations
 
+import functools
 import re
+from typing import Sequence
 
 from .types import ProtectedKind, Span
-from .util import is_ascii_digit, is_ascii_letter, is_han, is_punct_or_symbol, is_space
+from .util import HAN_RANGES, PUNCT_BIT, char_class
 
 
-_URL_RE = re.compile(r"https?://[^\s]+", re.IGNORECASE)
+try:  # Optional: linear-time DFA engine for large inputs.
+    import re2  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover
+    re2 = None
 
 
-def split_spans(text: str) -> list[Span]:
-    spans: list[Span] = []
-    i = 0
-    span_idx = 0
-    n = len(text)
-
-    def push_span(
-        span_type: str,
-        start: int,
-        end: int,
-        kind: ProtectedKind | None = None,
-    ) -> None:
-        nonlocal span_idx
-        if start >= end:
-            return
-        spans.append(
-            Span(
-                span_id=f"S{span_idx}",
-                type=span_type,  # type: ignore[arg-type]
-                kind=kind,
-                start=start,
-                end=end,
-                text=text[start:end],
-            )
-        )
-        span_idx += 1
-
-    while i < n:
-        m = _URL_RE.match(text, i)
-        if m:
-            push_span("protected", i, m.end(), kind="url")
-            i = m.end()
-            continue
-
-        ch = text[i]
-        if is_han(ch):
-            j = i + 1
-            while j < n and is_han(text[j]):
-                j += 1
-            push_span("han", i, j)
-            i = j
-            continue
-
-        if is_space(ch):
-            j = i + 1
-            while j < n and is_space(text[j]):
-                j += 1
-            push_span("protected", i, j, kind="space")
-            i = j
-            continue
-
-        if is_ascii_letter(ch):
-            j = i + 1
-            while j < n:
-                cj = text[j]
-                if is_ascii_letter(cj) or is_ascii_digit(cj) or cj in {"_", "-"}:
-                    j += 1
-                    continue
-                break
-            push_span("protected", i, j, kind="latin")
-            i = j
-            continue
-
-        if is_ascii_digit(ch):
-            j = i + 1
-            while j < n:
-                cj = text[j]
-                if is_ascii_digit(cj) or cj in {".", "%"}:
-                    j += 1
-                    continue
-                break
-            push_span("protected", i, j, kind="number")
-            i = j
-            continue
-
-        kind: ProtectedKind = "punct" if is_punct_or_symbol(ch) else "other"
-        push_span("protected", i, i + 1, kind=kind)
-        i += 1
+def _class_char(cp: int) -> str:
+    # \xhh for ASCII (control chars, "-", "]"), literal otherwise; both re and re2 accept this.
+    return f"\\x{cp:02x}" if cp < 0x80 else chr(cp)
+
+
+def _class_ranges(ranges: list[tuple[int, int]]) -> str:
+    return "".join(
+        _class_char(lo) if lo == hi else f"{_class_char(lo)}-{_class_char(hi)}" for lo, hi in ranges
+    )
+
+
+def _code_point_ranges(cps: list[int]) -> list[tuple[int, int]]:
+    ranges: list[tuple[int, int]] = []
+    for cp in cps:
+        if ranges and ranges[-1][1] == cp - 1:
+            ranges[-1] = (ranges[-1][0], cp)
+        else:
+            ranges.append((cp, cp))
+    return ranges
+
+
+def _trie_pattern(words: tuple[str, ...]) -> str:
+    """
+    Regex matching exactly `words`, factored along their prefix trie.
+    Shared prefixes are matched once instead of being retried per alternative.
+    """
+    trie: dict[str, dict] = {}
+    for w in words:
+        node = trie
+        for ch in w:
+            node = node.setdefault(ch, {})
+        node[""] = {}  # end of word
+
+    def emit(node: dict[str, dict]) -> str:
+        alts = [re.escape(ch) + emit(child) for ch, child in sorted(node.items()) if ch]
+        if not alts:
+            return ""
+        if len(alts) > 1:
+            body = "(?:" + "|".join(alts) + ")"
+            return body + "?" if "" in node else body
+        return f"(?:{alts[0]})?" if "" in node else alts[0]
+
+    return emit(trie)
+
+
+_URL_SCHEMES = ("http://", "https://")
+_HAN_CLASS = _class_ranges(list(HAN_RANGES))
+# Spelled out rather than `\s`: re2's `\s` is ASCII-only, while split_spans follows str.isspace().
+# (U+3000 is the highest str.isspace() code point.)
+_SPACE_CLASS = _class_ranges(_code_point_ranges([cp for cp in range(0x3001) if chr(cp).isspace()]))
+
+# One alternation scanned left to right by finditer; branch order matters (URLs win over latin).
+# The pattern is valid for both `re` and `re2` (leftmost-first alternation in both).
+_SPAN_PATTERN = (
+    r"(?s)"
+    rf"(?P<url>(?i:{_trie_pattern(_URL_SCHEMES)})[^{_SPACE_CLASS}]+)"
+    rf"|(?P<han>[{_HAN_CLASS}]+)"
+    rf"|(?P<space>[{_SPACE_CLASS}]+)"
+    r"|(?P<latin>[A-Za-z][A-Za-z0-9_\-]*)"
+    r"|(?P<number>[0-9][0-9.%]*)"
+    r"|(?P<other>.)"
+)
+_SPAN_RE = re.compile(_SPAN_PATTERN)
+
+# re2 pays a per-call setup cost; it only wins on long inputs.
+_RE2_MIN_LEN = 4096
+_SPAN_RE2 = None
+if re2 is not None:
+    try:
+        _SPAN_RE2 = re2.compile(_SPAN_PATTERN)
+    except Exception:  # noqa: BLE001
+        _SPAN_RE2 = None
 
+
+# lastgroup -> (span type, protected kind); "other" is resolved per character.
+_GROUP_TYPE_KIND: dict[str, tuple[str, ProtectedKind | None]] = {
+    "url": ("protected", "url"),
+    "han": ("han", None),
+    "space": ("protected", "space"),
+    "latin": ("protected", "latin"),
+    "number": ("protected", "number"),
+}
+_PUNCT_TYPE_KIND: tuple[str, ProtectedKind] = ("protected", "punct")
+_OTHER_TYPE_KIND: tuple[str, ProtectedKind] = ("protected", "other")
+
+
+# Shared "S<i>" ids: most texts fit in the table, so span ids are not formatted per call.
+_SPAN_IDS: tuple[str, ...] = tuple(f"S{i}" for i in range(4096))
+
+
+def _scan_spans(text: str) -> list[Span]:
+    matcher = _SPAN_RE2 if _SPAN_RE2 is not None and len(text) >= _RE2_MIN_LEN else _SPAN_RE
+    spans: list[Span] = []
+    append = spans.append
+    type_kind = _GROUP_TYPE_KIND.get
+    ids = _SPAN_IDS
+    n_ids = len(ids)
+    idx = 0
+    for m in matcher.finditer(text):
+        seg = m[0]
+        start, end = m.span()
+        tk = type_kind(m.lastgroup)  # type: ignore[arg-type]
+        if tk is None:
+            tk = _PUNCT_TYPE_KIND if char_class(seg) & PUNCT_BIT else _OTHER_TYPE_KIND
+        # Positional: Span(span_id, type, start, end, text, kind).
+        span_id = ids[idx] if idx < n_ids else f"S{idx}"
+        append(Span(span_id, tk[0], start, end, seg, tk[1]))  # type: ignore[arg-type]
+        idx += 1
     return spans
 
+
+# Short inputs (titles, list items, repeated UI strings) recur often; Span is frozen, so
+# cached spans can be handed out again as long as each caller gets its own list.
+_CACHE_MAX_LEN = 256
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_spans(text: str) -> tuple[Span, ...]:
+    return tuple(_scan_spans(text))
+
+
+def split_spans(text: str) -> list[Span]:
+    if len(text) < _CACHE_MAX_LEN:
+        return list(_cached_spans(text))
+    return _scan_spans(text)
+
+
+def split_spans_batch(texts: Sequence[str]) -> list[list[Span]]:
+    """`split_spans` over many texts, in order."""
+    return [split_spans(text) for text in texts]
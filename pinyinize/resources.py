@@ -1,58 +1,114 @@
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass
+import contextlib
+import copy
+import io
+import itertools
+import mmap
+import os
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, BinaryIO, Iterator, Mapping, Union
 
-from .util import is_han, normalize_pinyin
+from . import _json
+from .rules import RuleSet
+from .util import is_han_text, normalize_pinyin
 
 
-def _load_word_pinyin_map(path: Path) -> dict[str, str]:
+# Loaders take a file path, or an open binary stream (e.g. io.BytesIO) read from its position.
+_Source = Union[Path, BinaryIO]
+
+
+@contextlib.contextmanager
+def _mapped(path: Path) -> Iterator[memoryview | bytes]:
+    """Read-only view of the file's pages (no copy into Python); empty files yield b""."""
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            yield view
+
+
+def _load_json_file(src: _Source) -> Any:
+    if not isinstance(src, Path):
+        return _json.loads(src.read())
+    with _mapped(src) as buf:
+        return _json.loads(buf)
+
+
+_READ_CHUNK = 1 << 20
+
+
+def _json_record_chunks(src: _Source) -> Iterator[list[Any]]:
+    """
+    Records of a one-object-per-line file (bare lines with trailing commas, or wrapped
+    in "[" / "]" lines), yielded in lists. The file is read about a megabyte of lines at
+    a time and each chunk is parsed with one JSON call, so memory peaks at one chunk.
+    """
+    with src.open("rb") if isinstance(src, Path) else contextlib.nullcontext(src) as f:
+        while lines := f.readlines(_READ_CHUNK):
+            batch = []
+            for line in lines:
+                s = line.strip()
+                if not s or s == b"[" or s == b"]":
+                    continue
+                batch.append(s[:-1] if s.endswith(b",") else s)
+            if batch:
+                yield _json.loads(b"[" + b",".join(batch) + b"]")
+
+
+def _syllables(raw: list[str], pool: dict[str, str]) -> tuple[str, ...]:
+    """
+    Normalized syllables, drawn from `pool` (raw -> normalized). One pool per load is shared
+    by the per-char candidate lists: ~1.3k syllables against tens of thousands of entries.
+    """
+    out = []
+    for x in raw:
+        s = pool.get(x)
+        if s is None:
+            s = pool[x] = normalize_pinyin(x)
+        out.append(s)
+    return tuple(out)
+
+
+def _load_word_pinyin_map(src: _Source) -> dict[str, str]:
     out: dict[str, str] = {}
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            s = line.strip()
-            if not s or s == "[" or s == "]":
-                continue
-            if s.endswith(","):
-                s = s[:-1]
-            obj = json.loads(s)
-            word = obj.get("word")
-            pinyin = obj.get("pinyin")
-            if not isinstance(word, str) or not isinstance(pinyin, str):
-                continue
-            if not word:
-                continue
-            if not all(is_han(ch) for ch in word):
-                continue
-            out[word] = normalize_pinyin(pinyin)
+    for obj in itertools.chain.from_iterable(_json_record_chunks(src)):
+        if not isinstance(obj, dict):
+            continue
+        word = obj.get("word")
+        pinyin = obj.get("pinyin")
+        if not isinstance(word, str) or not isinstance(pinyin, str):
+            continue
+        if not is_han_text(word):
+            continue
+        out[word] = normalize_pinyin(pinyin)
     return out
 
 
-def _load_char_base(path: Path) -> dict[str, list[str]]:
-    out: dict[str, list[str]] = {}
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            s = line.strip()
-            if not s:
-                continue
-            if s.endswith(","):
-                s = s[:-1]
-            obj = json.loads(s)
-            ch = obj.get("char")
-            pinyin = obj.get("pinyin")
-            if isinstance(ch, str) and isinstance(pinyin, list) and all(
-                isinstance(x, str) for x in pinyin
-            ):
-                out[ch] = [normalize_pinyin(x) for x in pinyin]
+def _load_char_base(src: _Source, pool: dict[str, str] | None = None) -> dict[str, tuple[str, ...]]:
+    pool = {} if pool is None else pool
+    out: dict[str, tuple[str, ...]] = {}
+    for obj in itertools.chain.from_iterable(_json_record_chunks(src)):
+        if not isinstance(obj, dict):
+            continue
+        ch = obj.get("char")
+        pinyin = obj.get("pinyin")
+        if isinstance(ch, str) and isinstance(pinyin, list) and all(
+            isinstance(x, str) for x in pinyin
+        ):
+            out[ch] = _syllables(pinyin, pool)
     return out
 
 
-def _load_polyphone_candidates(path: Path) -> dict[str, list[str]]:
-    out: dict[str, list[str]] = {}
-    with path.open("r", encoding="utf-8") as f:
-        raw = json.load(f)
+def _load_polyphone_candidates(
+    src: _Source, pool: dict[str, str] | None = None
+) -> dict[str, tuple[str, ...]]:
+    pool = {} if pool is None else pool
+    out: dict[str, tuple[str, ...]] = {}
+    raw = _load_json_file(src)
     if not isinstance(raw, list):
         return out
     for obj in raw:
@@ -63,13 +119,12 @@ def _load_polyphone_candidates(path: Path) -> dict[str, list[str]]:
         if isinstance(ch, str) and isinstance(pinyin, list) and all(
             isinstance(x, str) for x in pinyin
         ):
-            out[ch] = [normalize_pinyin(x) for x in pinyin]
+            out[ch] = _syllables(pinyin, pool)
     return out
 
 
-def _load_polyphone_disambig(path: Path) -> tuple[dict[str, Any], dict[str, Any]]:
-    with path.open("r", encoding="utf-8") as f:
-        raw = json.load(f)
+def _load_polyphone_disambig(src: _Source) -> tuple[dict[str, Any], dict[str, Any]]:
+    raw = _load_json_file(src)
     items = raw.get("items", [])
     by_char: dict[str, Any] = {}
     if isinstance(items, list):
@@ -82,25 +137,19 @@ def _load_polyphone_disambig(path: Path) -> tuple[dict[str, Any], dict[str, Any]
     return by_char, thresholds
 
 
-def _load_overrides_rules(path: Path) -> list[dict[str, Any]]:
-    if not path.exists():
-        path.write_text(
-            json.dumps({"schema_version": 1, "rules": []}, ensure_ascii=False, indent=2)
-            + "\n",
-            encoding="utf-8",
-        )
+def _load_overrides_rules(src: _Source) -> list[dict[str, Any]]:
+    if isinstance(src, Path) and not src.exists():
+        src.write_bytes(_json.dumps({"schema_version": 1, "rules": []}, indent=True) + b"\n")
         return []
-    with path.open("r", encoding="utf-8") as f:
-        raw = json.load(f)
+    raw = _load_json_file(src)
     rules = raw.get("rules", [])
     return rules if isinstance(rules, list) else []
 
 
-def _load_lexicon(path: Path) -> dict[str, str]:
-    if not path.exists():
+def _load_lexicon(src: _Source) -> dict[str, str]:
+    if isinstance(src, Path) and not src.exists():
         return {}
-    with path.open("r", encoding="utf-8") as f:
-        raw = json.load(f)
+    raw = _load_json_file(src)
     if isinstance(raw, dict) and "items" in raw:
         items = raw.get("items")
         out: dict[str, str] = {}
@@ -110,31 +159,132 @@ def _load_lexicon(path: Path) -> dict[str, str]:
                     continue
                 w = it.get("word")
                 p = it.get("pinyin")
-                if isinstance(w, str) and isinstance(p, str) and w and all(
-                    is_han(ch) for ch in w
-                ):
+                if isinstance(w, str) and isinstance(p, str) and is_han_text(w):
                     out[w] = normalize_pinyin(p)
         return out
     if isinstance(raw, dict):
         out2: dict[str, str] = {}
         for k, v in raw.items():
-            if isinstance(k, str) and isinstance(v, str) and k and all(
-                is_han(ch) for ch in k
-            ):
+            if isinstance(k, str) and isinstance(v, str) and is_han_text(k):
                 out2[k] = normalize_pinyin(v)
         return out2
     return {}
 
 
+# Bump when the loaders' output changes shape so stale caches are rebuilt.
+_CACHE_VERSION = 2
+_COMPILED_FORMAT = "pinyinize-resources"
+
+# load_from_dir's file-name keywords and their defaults.
+_DATA_FILE_NAMES = {
+    "word_json": "word.json",
+    "char_base_json": "char_base.json",
+    "polyphone_json": "polyphone.json",
+    "polyphone_disambig_json": "polyphone_disambig.json",
+    "overrides_json": "overrides.json",
+    "lexicon_json": "lexicon.json",
+}
+
+
+def _source_stamp(base: Path, file_names: dict[str, str]) -> list[Any]:
+    stamp: list[Any] = []
+    for name in sorted(file_names.values()):
+        try:
+            st = (base / name).stat()
+        except FileNotFoundError:
+            stamp.append([name, None])
+        else:
+            stamp.append([name, st.st_size, st.st_mtime_ns])
+    return stamp
+
+
+def _dict_field(data: dict[str, Any], key: str) -> dict[str, Any]:
+    value = data.get(key)
+    if not isinstance(value, dict):
+        raise ValueError(f"compiled resource field {key!r} is not an object")
+    return value
+
+
+def _candidates_field(data: dict[str, Any], key: str) -> dict[str, tuple[str, ...]]:
+    pool: dict[str, str] = {}
+    out: dict[str, tuple[str, ...]] = {}
+    for ch, raw in _dict_field(data, key).items():
+        if not isinstance(raw, list) or not all(isinstance(x, str) for x in raw):
+            raise ValueError(f"compiled resource field {key!r} has a non-list entry for {ch!r}")
+        out[ch] = tuple(pool.setdefault(x, x) for x in raw)
+    return out
+
+
+def _read_compiled(path: Path) -> tuple[list[Any], "PinyinResources"]:
+    """
+    Parse a compiled resource file: one JSON object holding a format tag, version, source
+    stamp and the loaded tables. Plain data only, so reading a file never runs code from it.
+    """
+    with _mapped(path) as buf:
+        raw = _json.loads(buf)
+    if not (
+        isinstance(raw, dict)
+        and raw.get("format") == _COMPILED_FORMAT
+        and raw.get("version") == _CACHE_VERSION
+        and isinstance(raw.get("stamp"), list)
+        and isinstance(raw.get("data"), dict)
+    ):
+        raise ValueError(f"not a version {_CACHE_VERSION} compiled resource file: {path}")
+    data = raw["data"]
+    rules = data.get("overrides_rules")
+    if not isinstance(rules, list):
+        raise ValueError("compiled resource field 'overrides_rules' is not a list")
+    resources = PinyinResources(
+        word_pinyin=_dict_field(data, "word_pinyin"),
+        lexicon_pinyin=_dict_field(data, "lexicon_pinyin"),
+        char_base=_candidates_field(data, "char_base"),
+        polyphone_candidates=_candidates_field(data, "polyphone_candidates"),
+        polyphone_disambig=_dict_field(data, "polyphone_disambig"),
+        disambig_thresholds=_dict_field(data, "disambig_thresholds"),
+        overrides_rules=rules,
+    )
+    return raw["stamp"], resources
+
+
+def _write_compiled(path: Path, stamp: list[Any], resources: "PinyinResources") -> None:
+    doc = {
+        "format": _COMPILED_FORMAT,
+        "version": _CACHE_VERSION,
+        "stamp": stamp,
+        "data": {
+            "word_pinyin": resources.word_pinyin,
+            "lexicon_pinyin": resources.lexicon_pinyin,
+            "char_base": resources.char_base,
+            "polyphone_candidates": resources.polyphone_candidates,
+            "polyphone_disambig": resources.polyphone_disambig,
+            "disambig_thresholds": resources.disambig_thresholds,
+            "overrides_rules": resources.overrides_rules,
+        },
+    }
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(_json.dumps(doc))
+    os.replace(tmp, path)
+
+
 @dataclass(frozen=True)
 class PinyinResources:
     word_pinyin: dict[str, str]
     lexicon_pinyin: dict[str, str]
-    char_base: dict[str, list[str]]
-    polyphone_candidates: dict[str, list[str]]
+    char_base: dict[str, tuple[str, ...]]
+    polyphone_candidates: dict[str, tuple[str, ...]]
     polyphone_disambig: dict[str, Any]
     disambig_thresholds: dict[str, Any]
     overrides_rules: list[dict[str, Any]]
+    _combined_word_pinyin: Mapping[str, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _max_len_by_first_char: Mapping[str, int] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # (private deep copy of overrides_rules, RuleSet built from that copy).
+    _rule_set: tuple[list[Any], RuleSet] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @staticmethod
     def load_from_dir(
@@ -157,8 +307,9 @@ class PinyinResources:
 
         word_pinyin = _load_word_pinyin_map(word_path)
         lexicon_pinyin = _load_lexicon(lexicon_path)
-        char_base = _load_char_base(char_base_path)
-        polyphone_candidates = _load_polyphone_candidates(polyphone_path)
+        pool: dict[str, str] = {}
+        char_base = _load_char_base(char_base_path, pool)
+        polyphone_candidates = _load_polyphone_candidates(polyphone_path, pool)
         polyphone_disambig, thresholds = _load_polyphone_disambig(disambig_path)
         overrides_rules = _load_overrides_rules(overrides_path)
 
@@ -172,7 +323,114 @@ class PinyinResources:
             overrides_rules=overrides_rules,
         )
 
-    def combined_word_pinyin(self) -> dict[str, str]:
-        merged = dict(self.word_pinyin)
-        merged.update(self.lexicon_pinyin)
-        return merged
+    @staticmethod
+    def load_from_mapping(files: Mapping[str, bytes], **file_names: str) -> "PinyinResources":
+        """
+        `load_from_dir` over in-memory file contents keyed by file name.
+        A missing lexicon or overrides file loads as empty, as on disk; a missing
+        required file raises KeyError.
+        """
+        names = {**_DATA_FILE_NAMES, **file_names}
+
+        def src(key: str) -> BinaryIO:
+            return io.BytesIO(files[names[key]])
+
+        pool: dict[str, str] = {}
+        polyphone_disambig, thresholds = _load_polyphone_disambig(src("polyphone_disambig_json"))
+        return PinyinResources(
+            word_pinyin=_load_word_pinyin_map(src("word_json")),
+            lexicon_pinyin=_load_lexicon(src("lexicon_json")) if names["lexicon_json"] in files else {},
+            char_base=_load_char_base(src("char_base_json"), pool),
+            polyphone_candidates=_load_polyphone_candidates(src("polyphone_json"), pool),
+            polyphone_disambig=polyphone_disambig,
+            disambig_thresholds=thresholds,
+            overrides_rules=(
+                _load_overrides_rules(src("overrides_json")) if names["overrides_json"] in files else []
+            ),
+        )
+
+    @staticmethod
+    def load_compiled(path: str | Path) -> "PinyinResources":
+        """
+        Load a file written by `save_compiled` (or `load_from_cache`): the loaded tables as
+        a single JSON document, so none of the per-file parsing and normalization is redone.
+        The file is data only; a malformed one raises ValueError.
+        """
+        return _read_compiled(Path(path))[1]
+
+    def save_compiled(self, path: str | Path) -> None:
+        """
+        Write the tables for `load_compiled`. The file records no source stamp, so
+        `load_from_cache` never reuses it and rebuilds the cache from the data dir instead.
+        """
+        _write_compiled(Path(path), [], self)
+
+    @staticmethod
+    def load_from_cache(
+        data_dir: str | Path, cache_path: str | Path, **file_names: str
+    ) -> "PinyinResources":
+        """
+        `load_from_dir`, memoized as a compiled file at `cache_path`.
+        The cache is rebuilt when a source file's size or mtime changes, or when it
+        cannot be read back. Like `load_compiled` it is read as plain JSON data, so a
+        tampered cache file can at worst supply wrong tables, never run code.
+        """
+        base = Path(data_dir)
+        cache = Path(cache_path)
+        names = {**_DATA_FILE_NAMES, **file_names}
+        try:
+            stamp, resources = _read_compiled(cache)
+            if stamp == _source_stamp(base, names):
+                return resources
+        except Exception:  # noqa: BLE001 - a missing or unreadable cache is rebuilt
+            pass
+
+        resources = PinyinResources.load_from_dir(base, **names)
+        # Stamp after loading: load_from_dir may create overrides.json.
+        _write_compiled(cache, _source_stamp(base, names), resources)
+        return resources
+
+    def combined_word_pinyin(self) -> Mapping[str, str]:
+        """word_pinyin with lexicon entries on top, as a read-only view built once and shared."""
+        view = self._combined_word_pinyin
+        if view is None:
+            merged = dict(self.word_pinyin)
+            merged.update(self.lexicon_pinyin)
+            view = MappingProxyType(merged)
+            object.__setattr__(self, "_combined_word_pinyin", view)
+        return view
+
+    def max_len_by_first_char(self) -> Mapping[str, int]:
+        """Longest combined_word_pinyin word per first character, as a read-only view built once."""
+        view = self._max_len_by_first_char
+        if view is None:
+            lengths: dict[str, int] = {}
+            for w in self.combined_word_pinyin():
+                if not w:
+                    continue
+                fc = w[0]
+                lengths[fc] = max(lengths.get(fc, 0), len(w))
+            view = MappingProxyType(lengths)
+            object.__setattr__(self, "_max_len_by_first_char", view)
+        return view
+
+    def rule_set(self) -> RuleSet:
+        """
+        overrides_rules sorted, indexed and compiled. Built from a private deep copy of the
+        rules and rebuilt whenever overrides_rules no longer equals it, so rules added, removed,
+        replaced or edited in place are all picked up.
+        """
+        memo = self._rule_set
+        if memo is None or memo[0] != self.overrides_rules:
+            snapshot = copy.deepcopy(self.overrides_rules)
+            memo = (snapshot, RuleSet.build(snapshot))
+            object.__setattr__(self, "_rule_set", memo)
+        return memo[1]
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Pickles (e.g. to worker processes) keep only the loaded data; the memos are rebuilt on demand.
+        state = dict(self.__dict__)
+        state.pop("_combined_word_pinyin", None)
+        state.pop("_max_len_by_first_char", None)
+        state.pop("_rule_set", None)
+        return state
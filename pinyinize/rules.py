@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import functools
 import re
+import sys
 from dataclasses import dataclass
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping, Sequence
 
 from .types import Rule, Token
 
 
-@dataclass(frozen=True)
+# slots: one instance per override application.
+@dataclass(frozen=True, slots=True)
 class AppliedRule:
     rule_id: str
     token_start: int
@@ -18,6 +22,12 @@ class AppliedRule:
     choose: str
 
 
+# Rule regexes are plain strings in overrides.json; compile each distinct one once.
+# Unlike re's internal cache this is not flushed when it fills up.
+_compile_regex = functools.lru_cache(maxsize=4096)(re.compile)
+
+
+# Criteria are checked cheapest first: string/set tests, then substring scans, then the regex.
 def _match_part(part: dict[str, Any], tok: Token) -> bool:
     txt = tok.text
     if "text" in part and part["text"] != txt:
@@ -26,10 +36,6 @@ def _match_part(part: dict[str, Any], tok: Token) -> bool:
         vals = part["text_in"]
         if isinstance(vals, list) and txt not in vals:
             return False
-    if "regex" in part:
-        rx = part["regex"]
-        if isinstance(rx, str) and not re.search(rx, txt):
-            return False
     if "upos_in" in part:
         vals = part["upos_in"]
         if isinstance(vals, list) and tok.upos not in vals:
@@ -48,9 +54,193 @@ def _match_part(part: dict[str, Any], tok: Token) -> bool:
             for ch in vals:
                 if isinstance(ch, str) and ch and ch not in txt:
                     return False
+    if "regex" in part:
+        rx = part["regex"]
+        if isinstance(rx, str):
+            rx = _compile_regex(rx)
+        if isinstance(rx, re.Pattern) and not rx.search(txt):
+            return False
     return True
 
 
+class _InvalidPattern:
+    """
+    Stand-in for a rule regex that failed to compile. Its `search` raises the compile error,
+    so the error surfaces only for tokens that reach the regex criterion, as with `_match_part`.
+    """
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: re.error) -> None:
+        self.error = error
+
+    def search(self, text: str) -> None:
+        raise re.error(self.error.msg, self.error.pattern, self.error.pos)
+
+
+def _str_set(vals: Any) -> frozenset[str] | None:
+    # Non-list values are ignored by _match_part; non-string items can never equal a token field.
+    if not isinstance(vals, list):
+        return None
+    return frozenset(sys.intern(v) for v in vals if isinstance(v, str))
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledPart:
+    """
+    A rule match part parsed once; None (or an empty `contains`) means the criterion is absent.
+    Fields are in evaluation order.
+    """
+
+    text: str | None = None
+    text_in: frozenset[str] | None = None
+    upos_in: frozenset[str] | None = None
+    xpos_in: frozenset[str] | None = None
+    ner_in: frozenset[str] | None = None
+    prefix: str | None = None
+    suffixes: tuple[str, ...] | None = None
+    contains: tuple[str, ...] = ()
+    regex: re.Pattern[str] | _InvalidPattern | None = None
+    # Set when `text` is present but not a string, which no token can equal.
+    never: bool = False
+
+    def matches(self, tok: Token) -> bool:
+        if self.never:
+            return False
+        txt = tok.text
+        if self.text is not None and self.text != txt:
+            return False
+        if self.text_in is not None and txt not in self.text_in:
+            return False
+        if self.upos_in is not None and tok.upos not in self.upos_in:
+            return False
+        if self.xpos_in is not None and tok.xpos not in self.xpos_in:
+            return False
+        if self.ner_in is not None and tok.ner not in self.ner_in:
+            return False
+        if self.prefix is not None and not txt.startswith(self.prefix):
+            return False
+        if self.suffixes is not None and not txt.endswith(self.suffixes):
+            return False
+        for ch in self.contains:
+            if ch not in txt:
+                return False
+        if self.regex is not None and not self.regex.search(txt):
+            return False
+        return True
+
+
+def _literal_regex(pattern: str) -> tuple[bool, bool, list[str]] | None:
+    """
+    Split a pattern made only of literal text and `^`/`$` anchors, optionally a `^(?:a|b)$`
+    alternation, into (anchored_start, anchored_end, literals); None for any other syntax.
+    """
+    start = pattern.startswith("^")
+    body = pattern[1:] if start else pattern
+    end = body.endswith("$")
+    body = body[:-1] if end else body
+    if start and end and body.startswith("(?:") and body.endswith(")"):
+        alts = body[3:-1].split("|")
+    else:
+        alts = [body]
+    if any(re.escape(a) != a for a in alts):
+        return None
+    if len(alts) > 1 and not (start and end):
+        return None
+    return start, end, alts
+
+
+def compile_part(part: dict[str, Any]) -> CompiledPart:
+    """
+    Parse a match part into a CompiledPart that accepts exactly the tokens `_match_part` does.
+    Literal strings are interned, so a hit against an interned token text is an identity check.
+    A regex that is only anchored literal text becomes string tests and skips the regex engine.
+    """
+    text = part.get("text")
+    text_in = _str_set(part.get("text_in"))
+    contains = part.get("contains")
+    contains_t = (
+        tuple(ch for ch in contains if isinstance(ch, str) and ch) if isinstance(contains, list) else ()
+    )
+    prefix: str | None = None
+    suffixes: tuple[str, ...] | None = None
+    rx = part.get("regex")
+    literal = _literal_regex(rx) if isinstance(rx, str) else None
+    if literal is not None:
+        start, end, alts = literal
+        # Without MULTILINE, `$` also matches before a single trailing newline.
+        ends = [a + e for a in alts for e in ("", "\n")] if end else alts
+        if start and end:
+            full = frozenset(sys.intern(a) for a in ends)
+            text_in = full if text_in is None else text_in & full
+        elif start:
+            prefix = alts[0]
+        elif end:
+            suffixes = tuple(ends)
+        elif alts[0]:
+            contains_t += (alts[0],)
+        rx = None
+    elif isinstance(rx, str):
+        try:
+            rx = _compile_regex(rx)
+        except re.error as e:
+            rx = _InvalidPattern(e)
+    return CompiledPart(
+        text=sys.intern(text) if isinstance(text, str) else None,
+        text_in=text_in,
+        upos_in=_str_set(part.get("upos_in")),
+        xpos_in=_str_set(part.get("xpos_in")),
+        ner_in=_str_set(part.get("ner_in")),
+        prefix=prefix,
+        suffixes=suffixes,
+        contains=contains_t,
+        regex=rx if isinstance(rx, (re.Pattern, _InvalidPattern)) else None,
+        never="text" in part and not isinstance(text, str),
+    )
+
+
+def match_part_batch(part: dict[str, Any] | CompiledPart, tokens: Sequence[Token]) -> list[bool]:
+    """
+    Evaluate one match part against every token of a sentence.
+    Each criterion filters the surviving positions in a single pass, cheapest first, so
+    tokens rejected early are never looked at by the later (regex/contains) criteria.
+    """
+    cp = part if isinstance(part, CompiledPart) else compile_part(part)
+    out = [False] * len(tokens)
+    if cp.never:
+        return out
+    alive: Sequence[int] = range(len(tokens))
+    if cp.text is not None:
+        text = cp.text
+        alive = [i for i in alive if tokens[i].text == text]
+    if cp.text_in is not None:
+        text_in = cp.text_in
+        alive = [i for i in alive if tokens[i].text in text_in]
+    if cp.upos_in is not None:
+        upos_in = cp.upos_in
+        alive = [i for i in alive if tokens[i].upos in upos_in]
+    if cp.xpos_in is not None:
+        xpos_in = cp.xpos_in
+        alive = [i for i in alive if tokens[i].xpos in xpos_in]
+    if cp.ner_in is not None:
+        ner_in = cp.ner_in
+        alive = [i for i in alive if tokens[i].ner in ner_in]
+    if cp.prefix is not None:
+        prefix = cp.prefix
+        alive = [i for i in alive if tokens[i].text.startswith(prefix)]
+    if cp.suffixes is not None:
+        suffixes = cp.suffixes
+        alive = [i for i in alive if tokens[i].text.endswith(suffixes)]
+    for ch in cp.contains:
+        alive = [i for i in alive if ch in tokens[i].text]
+    if cp.regex is not None:
+        search = cp.regex.search
+        alive = [i for i in alive if search(tokens[i].text)]
+    for i in alive:
+        out[i] = True
+    return out
+
+
 def rule_matches(rule: Rule, tok: Token, prev_tok: Token | None, next_tok: Token | None) -> bool:
     match = rule.get("match") or {}
     if not isinstance(match, dict):
@@ -84,6 +274,83 @@ def rule_matches(rule: Rule, tok: Token, prev_tok: Token | None, next_tok: Token
     return True
 
 
+_NEVER = CompiledPart(never=True)
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledMatch:
+    """A rule's `match` with each part compiled; None means the rule has no such part."""
+
+    self_part: CompiledPart | None = None
+    prev: CompiledPart | None = None
+    next: CompiledPart | None = None
+
+    def matches(self, tok: Token, prev_tok: Token | None, next_tok: Token | None) -> bool:
+        if self.self_part is not None and not self.self_part.matches(tok):
+            return False
+        if self.prev is not None and (prev_tok is None or not self.prev.matches(prev_tok)):
+            return False
+        if self.next is not None and (next_tok is None or not self.next.matches(next_tok)):
+            return False
+        return True
+
+    def match_batch(self, tokens: Sequence[Token]) -> list[bool]:
+        """`matches` at every position of a sentence, with prev/next taken from the neighbours."""
+        n = len(tokens)
+        ok = match_part_batch(self.self_part, tokens) if self.self_part is not None else [True] * n
+        if n == 0:
+            return ok
+        if self.prev is not None:
+            prev_ok = match_part_batch(self.prev, tokens)
+            ok = [False] + [a and b for a, b in zip(ok[1:], prev_ok)]
+        if self.next is not None:
+            next_ok = match_part_batch(self.next, tokens)
+            ok = [a and b for a, b in zip(ok, next_ok[1:])] + [False]
+        return ok
+
+
+def compile_match(rule: Rule) -> CompiledMatch:
+    """Compile a rule's `match` into a CompiledMatch that agrees with `rule_matches`."""
+    match = rule.get("match") or {}
+    if not isinstance(match, dict):
+        return CompiledMatch(self_part=_NEVER)
+
+    def part(key: str) -> CompiledPart | None:
+        p = match.get(key)
+        if p is None:
+            return None
+        return compile_part(p) if isinstance(p, dict) else _NEVER
+
+    return CompiledMatch(self_part=part("self"), prev=part("prev"), next=part("next"))
+
+
+def build_rule_index(rules: list[Rule]) -> tuple[dict[str, list[Rule]], list[Rule]]:
+    """
+    Split rules by the literal token text they require.
+    Returns (by_text, residual): rules with `match.self.text` or `match.self.text_in` are listed
+    under each of those texts, in input order; all other rules go to `residual`.
+    """
+    by_text: dict[str, list[Rule]] = {}
+    residual: list[Rule] = []
+    for rule in rules:
+        match = rule.get("match")
+        self_part = match.get("self") if isinstance(match, dict) else None
+        keys: list[str] = []
+        if isinstance(self_part, dict):
+            text = self_part.get("text")
+            text_in = self_part.get("text_in")
+            if isinstance(text, str):
+                keys = [text]
+            elif isinstance(text_in, list) and all(isinstance(t, str) for t in text_in):
+                keys = list(dict.fromkeys(text_in))
+        if not keys:
+            residual.append(rule)
+            continue
+        for key in keys:
+            by_text.setdefault(key, []).append(rule)
+    return by_text, residual
+
+
 def sort_rules(rules: list[Rule]) -> list[Rule]:
     def key(r: Rule) -> tuple[int, str]:
         prio = r.get("priority")
@@ -94,3 +361,29 @@ def sort_rules(rules: list[Rule]) -> list[Rule]:
         return (-prio_int, rid_str)
 
     return sorted(rules, key=key)
+
+
+@dataclass(frozen=True, slots=True)
+class RuleSet:
+    """
+    Override rules prepared once per rule list: `ordered` is the sort_rules order, and
+    `by_text`/`residual` are the build_rule_index split. `matchers[i]` is the compiled match of
+    `ordered[i]`. Rules without a string id are dropped.
+    """
+
+    ordered: tuple[Rule, ...]
+    by_text: Mapping[str, tuple[Rule, ...]]
+    residual: tuple[Rule, ...]
+    matchers: tuple[CompiledMatch, ...]
+
+    @staticmethod
+    def build(rules: Sequence[Any]) -> "RuleSet":
+        parsed: list[Rule] = [r for r in rules if isinstance(r, dict) and isinstance(r.get("id"), str)]
+        by_text, residual = build_rule_index(parsed)
+        ordered = tuple(sort_rules(parsed))
+        return RuleSet(
+            ordered=ordered,
+            by_text=MappingProxyType({text: tuple(keyed) for text, keyed in by_text.items()}),
+            residual=tuple(residual),
+            matchers=tuple(compile_match(r) for r in ordered),
+        )
@@ -18,7 +18,8 @@ ProtectedKind = Literal[
 SegmenterName = Literal["greedy", "ollama", "jieba"]
 
 
-@dataclass(frozen=True)
+# slots: split_spans allocates one Span per run of characters.
+@dataclass(frozen=True, slots=True)
 class Span:
     span_id: str
     type: SpanType
@@ -28,7 +29,8 @@ class Span:
     kind: ProtectedKind | None = None
 
 
-@dataclass(frozen=True)
+# slots: rule matching reads text/upos/xpos/ner on every token of every window.
+@dataclass(frozen=True, slots=True)
 class Token:
     span_id: str
     index_in_span: int
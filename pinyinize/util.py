@@ -1,27 +1,100 @@
 from __future__ import annotations
 
+import re
+import threading
 import unicodedata
+from array import array
+
+# Character class bits, looked up through a two-level table (block -> class bytes).
+HAN_BIT = 1
+SPACE_BIT = 2
+PUNCT_BIT = 4  # Unicode category P* or S*
+ASCII_LETTER_BIT = 8
+ASCII_DIGIT_BIT = 16
+
+# CJK Unified Ideographs + extensions + compatibility ideographs.
+HAN_RANGES = (
+    (0x3400, 0x4DBF),
+    (0x4E00, 0x9FFF),
+    (0xF900, 0xFAFF),
+    (0x20000, 0x2A6DF),
+    (0x2A700, 0x2B73F),
+    (0x2B740, 0x2B81F),
+    (0x2B820, 0x2CEAF),
+    (0x2CEB0, 0x2EBEF),
+)
+
+_BLOCK_SHIFT = 7
+_BLOCK_SIZE = 1 << _BLOCK_SHIFT
+_BLOCK_MASK = _BLOCK_SIZE - 1
+
+# Level 1: block number -> start of its class bytes in _BLOCK_DATA (-1 until first use).
+# Level 2: deduplicated 128-byte blocks; e.g. every all-Han block shares one entry.
+# Blocks are classified lazily because walking all 0x110000 code points costs ~0.3s at import.
+_BLOCK_START = array("l", [-1]) * (0x110000 >> _BLOCK_SHIFT)
+_BLOCK_DATA = bytearray()
+_BLOCK_DEDUP: dict[bytes, int] = {}
+_BLOCK_LOCK = threading.Lock()
+
+
+def _classify_code_point(cp: int) -> int:
+    bits = 0
+    for lo, hi in HAN_RANGES:
+        if lo <= cp <= hi:
+            bits |= HAN_BIT
+            break
+    ch = chr(cp)
+    if ch.isspace():
+        bits |= SPACE_BIT
+    if unicodedata.category(ch)[0] in "PS":
+        bits |= PUNCT_BIT
+    if 65 <= cp <= 90 or 97 <= cp <= 122:
+        bits |= ASCII_LETTER_BIT
+    elif 48 <= cp <= 57:
+        bits |= ASCII_DIGIT_BIT
+    return bits
+
+
+def _build_block(block: int) -> int:
+    base = block << _BLOCK_SHIFT
+    data = bytes(_classify_code_point(cp) for cp in range(base, base + _BLOCK_SIZE))
+    with _BLOCK_LOCK:
+        start = _BLOCK_DEDUP.get(data)
+        if start is None:
+            start = len(_BLOCK_DATA)
+            _BLOCK_DATA.extend(data)
+            _BLOCK_DEDUP[data] = start
+        _BLOCK_START[block] = start
+    return start
+
+
+def char_class(ch: str) -> int:
+    """Class bits (HAN_BIT, SPACE_BIT, ...) of a single character."""
+    cp = ord(ch)
+    start = _BLOCK_START[cp >> _BLOCK_SHIFT]
+    if start < 0:
+        start = _build_block(cp >> _BLOCK_SHIFT)
+    return _BLOCK_DATA[start + (cp & _BLOCK_MASK)]
 
 
 def is_han(ch: str) -> bool:
     if not ch:
         return False
-    cp = ord(ch)
-    # CJK Unified Ideographs + extensions + compatibility ideographs.
-    return (
-        (0x3400 <= cp <= 0x4DBF)
-        or (0x4E00 <= cp <= 0x9FFF)
-        or (0xF900 <= cp <= 0xFAFF)
-        or (0x20000 <= cp <= 0x2A6DF)
-        or (0x2A700 <= cp <= 0x2B73F)
-        or (0x2B740 <= cp <= 0x2B81F)
-        or (0x2B820 <= cp <= 0x2CEAF)
-        or (0x2CEB0 <= cp <= 0x2EBEF)
-    )
+    return bool(char_class(ch) & HAN_BIT)
+
+
+_HAN_TEXT_RE = re.compile("[" + "".join(f"{chr(lo)}-{chr(hi)}" for lo, hi in HAN_RANGES) + "]+")
+
+
+def is_han_text(s: str) -> bool:
+    """True for a non-empty string of Han characters only; one regex match instead of a loop."""
+    return _HAN_TEXT_RE.fullmatch(s) is not None
 
 
 def is_space(ch: str) -> bool:
-    return ch.isspace()
+    if len(ch) != 1:
+        return ch.isspace()
+    return bool(char_class(ch) & SPACE_BIT)
 
 
 def is_ascii_letter(ch: str) -> bool:
@@ -35,8 +108,7 @@ def is_ascii_digit(ch: str) -> bool:
 
 
 def is_punct_or_symbol(ch: str) -> bool:
-    cat = unicodedata.category(ch)
-    return cat.startswith("P") or cat.startswith("S")
+    return bool(char_class(ch) & PUNCT_BIT)
 
 
 def normalize_word_pinyin(pinyin: str) -> str:
@@ -50,5 +122,8 @@ def normalize_pinyin(pinyin: str) -> str:
     return pinyin.replace("ɡ", "g").replace("v", "ü").replace("V", "Ü")
 
 
+_WORD_LIKE_PROTECTED_KINDS = frozenset({"url", "latin", "number"})
+
+
 def is_word_like_protected_kind(kind: str | None) -> bool:
-    return kind in {"url", "latin", "number"}
+    return kind in _WORD_LIKE_PROTECTED_KINDS
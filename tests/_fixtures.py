@@ -0,0 +1,154 @@
+"""Shared data sets for the test suites.
+
+Payloads are encoded once at import time. `load_resources` parses a data set straight
+from memory and memoizes the result; tests that need the files on disk write them with
+`write_data_set`.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+from pathlib import Path
+from typing import Any, Mapping
+
+from pinyinize import _json
+from pinyinize.resources import PinyinResources
+
+
+def _dumps(obj: Any) -> str:
+    return _json.dumps(obj).decode("utf-8")
+
+
+def _json_bytes(obj: Any) -> bytes:
+    return (_dumps(obj) + "\n").encode("utf-8")
+
+
+def _jsonl_bytes(items: list[dict[str, Any]]) -> bytes:
+    """One object per line with a trailing comma (the word.json/char_base.json layout)."""
+    return "".join(_dumps(it) + ",\n" for it in items).encode("utf-8")
+
+
+def _json_array_lines_bytes(items: list[dict[str, Any]]) -> bytes:
+    """A JSON array with one object per line."""
+    return ("[\n" + ",\n".join(_dumps(it) for it in items) + "\n]\n").encode("utf-8")
+
+
+_THRESHOLDS = {"min_support": 5, "min_prob": 0.85, "min_margin": 0.15}
+_EMPTY_OVERRIDES = _json_bytes({"schema_version": 1, "rules": []})
+_EMPTY_LEXICON = _json_bytes({"schema_version": 1, "items": []})
+
+
+# Acceptance criteria data set (tests/test_pinyinize.py).
+MIN_DATA_FILES: Mapping[str, bytes] = {
+    "word.json": _json_array_lines_bytes(
+        [
+            {"word": "细说", "pinyin": "xì shuō"},
+            {"word": "银行", "pinyin": "yín háng"},
+            {"word": "行长", "pinyin": "háng zhǎng"},
+            {"word": "重新", "pinyin": "chóng xīn"},
+            {"word": "营业", "pinyin": "yíng yè"},
+            {"word": "得到", "pinyin": "dé dào"},
+            {"word": "答案", "pinyin": "dá àn"},
+            {"word": "得去", "pinyin": "děi qù"},
+        ]
+    ),
+    "char_base.json": _jsonl_bytes(
+        [
+            {"index": 1, "char": "他", "pinyin": ["tā"]},
+            {"index": 2, "char": "的", "pinyin": ["de"]},
+        ]
+    ),
+    "polyphone.json": b"[]\n",
+    "polyphone_disambig.json": _json_bytes(
+        {"schema": "test", "thresholds": _THRESHOLDS, "items": []}
+    ),
+    "overrides.json": _EMPTY_OVERRIDES,
+    "lexicon.json": _json_bytes(
+        {
+            "schema_version": 1,
+            "items": [
+                {"word": "行长", "pinyin": "háng zhǎng"},
+                {"word": "得去", "pinyin": "děi qù"},
+            ],
+        }
+    ),
+}
+
+
+# Mocked and live Ollama data set (tests/test_ollama.py).
+OLLAMA_DATA_FILES: Mapping[str, bytes] = {
+    "word.json": _jsonl_bytes(
+        [
+            {"word": "银行", "pinyin": "yín háng"},
+            {"word": "行长", "pinyin": "háng zhǎng"},
+        ]
+    ),
+    "char_base.json": _jsonl_bytes(
+        [
+            {"index": 1, "char": "银", "pinyin": ["yín"]},
+            {"index": 2, "char": "行", "pinyin": ["xíng", "háng"]},
+            {"index": 3, "char": "长", "pinyin": ["cháng", "zhǎng"]},
+            {"index": 4, "char": "测", "pinyin": ["cè"]},
+            {"index": 5, "char": "试", "pinyin": ["shì"]},
+        ]
+    ),
+    "polyphone.json": _json_bytes(
+        [
+            {"index": 1, "char": "行", "pinyin": ["xíng", "háng"]},
+            {"index": 2, "char": "长", "pinyin": ["cháng", "zhǎng"]},
+        ]
+    ),
+    "polyphone_disambig.json": _json_bytes(
+        {"schema": "test", "thresholds": _THRESHOLDS, "items": []}
+    ),
+    "overrides.json": _EMPTY_OVERRIDES,
+    "lexicon.json": _EMPTY_LEXICON,
+}
+
+
+# Edge case data set (tests/test_integration.py TestEdgeCases).
+EDGE_DATA_FILES: Mapping[str, bytes] = {
+    "word.json": b"",
+    "char_base.json": _jsonl_bytes(
+        [
+            {"index": 1, "char": "测", "pinyin": ["cè"]},
+            {"index": 2, "char": "试", "pinyin": ["shì"]},
+        ]
+    ),
+    "polyphone.json": b"[]\n",
+    "polyphone_disambig.json": _json_bytes(
+        {"schema": "edge_test", "thresholds": _THRESHOLDS, "items": []}
+    ),
+    "overrides.json": _EMPTY_OVERRIDES,
+    "lexicon.json": _EMPTY_LEXICON,
+}
+
+
+def fingerprint(files: Mapping[str, bytes]) -> str:
+    """Content hash of a data set, used as the `load_resources` cache key."""
+    h = hashlib.sha1()
+    for name in sorted(files):
+        h.update(name.encode("utf-8") + b"\0" + files[name] + b"\0")
+    return h.hexdigest()
+
+
+_DATA_SETS: dict[str, Mapping[str, bytes]] = {
+    fingerprint(MIN_DATA_FILES): MIN_DATA_FILES,
+    fingerprint(OLLAMA_DATA_FILES): OLLAMA_DATA_FILES,
+    fingerprint(EDGE_DATA_FILES): EDGE_DATA_FILES,
+}
+MIN_DATA_FINGERPRINT = fingerprint(MIN_DATA_FILES)
+OLLAMA_DATA_FINGERPRINT = fingerprint(OLLAMA_DATA_FILES)
+EDGE_DATA_FINGERPRINT = fingerprint(EDGE_DATA_FILES)
+
+
+def write_data_set(root: Path, data_fingerprint: str) -> None:
+    for name, blob in _DATA_SETS[data_fingerprint].items():
+        root.joinpath(name).write_bytes(blob)
+
+
+@functools.lru_cache(maxsize=None)
+def load_resources(data_fingerprint: str) -> PinyinResources:
+    """Load the data set from memory; later calls reuse the parsed resources."""
+    return PinyinResources.load_from_mapping(_DATA_SETS[data_fingerprint])
@@ -0,0 +1,37 @@
+"""Hand-written LLM adapter stubs for the test suites."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Union
+
+_Response = Union[dict[str, Any], Callable[[dict[str, Any]], Any]]
+
+
+class StubLLMAdapter:
+    """
+    Minimal segment_and_tag/double_check adapter.
+    Each response is either a fixed value or a callable applied to the request payload;
+    every call is recorded in `calls` as (method_name, payload).
+    """
+
+    def __init__(
+        self,
+        *,
+        seg_response: _Response | None = None,
+        dc_response: _Response | None = None,
+    ) -> None:
+        self.seg_response = seg_response
+        self.dc_response = dc_response
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+
+    def _respond(self, name: str, response: _Response | None, payload: dict[str, Any]) -> Any:
+        self.calls.append((name, payload))
+        if response is None:
+            raise AssertionError(f"unexpected {name} call")
+        return response(payload) if callable(response) else response
+
+    def segment_and_tag(self, payload: dict[str, Any]) -> Any:
+        return self._respond("segment_and_tag", self.seg_response, payload)
+
+    def double_check(self, payload: dict[str, Any]) -> Any:
+        return self._respond("double_check", self.dc_response, payload)
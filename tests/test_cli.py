@@ -89,6 +89,21 @@ class TestCLI(unittest.TestCase):
                     self.assertIn("yínháng", output)
                     self.assertIn("hángzhǎng", output)
 
+    def test_compiled_resources(self) -> None:
+        """Test --compile-resources output can stand in for --data-dir."""
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            self._create_test_data(root)
+            compiled = root / "resources.json"
+
+            self.assertEqual(main(["--data-dir", str(root), "--compile-resources", str(compiled)]), 0)
+            self.assertTrue(compiled.exists())
+
+            with patch("sys.stdout", new=StringIO()) as fake_stdout:
+                result = main(["--data-dir", str(Path(td) / "missing"), "--resources", str(compiled), "银行"])
+                self.assertEqual(result, 0)
+                self.assertIn("yínháng", fake_stdout.getvalue())
+
     def test_report_output(self) -> None:
         """Test writing report to file."""
         with tempfile.TemporaryDirectory() as td:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import re
 import tempfile
 import unittest
 from pathlib import Path
@@ -140,6 +141,22 @@ class TestBasicPinyin(unittest.TestCase):
             results = pinyinize("你我他", opts)
             self.assertTrue(any(all(x in r.output_text for x in ["nǐ", "wǒ", "tā"]) for r in results))
 
+    def test_tables_shared_across_calls(self) -> None:
+        """Test separate pinyinize calls reuse the word tables built by the first one."""
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            self._create_minimal_data(root)
+            resources = PinyinResources.load_from_dir(root)
+            opts = PinyinizeOptions(resources=resources)
+
+            pinyinize("细说", opts)
+            combined = resources.combined_word_pinyin()
+            lengths = resources.max_len_by_first_char()
+            results = pinyinize("银行行长", opts)
+            self.assertTrue(any(r.output_text == "yínháng hángzhǎng" for r in results))
+            self.assertIs(resources.combined_word_pinyin(), combined)
+            self.assertIs(resources.max_len_by_first_char(), lengths)
+
 
 class TestMixedContent(unittest.TestCase):
     """Tests for mixed Chinese and non-Chinese content."""
@@ -383,6 +400,48 @@ class TestOverrideRules(unittest.TestCase):
             results = pinyinize("行", opts)
             self.assertTrue(any("xíng" in r.output_text for r in results))
 
+    def test_invalid_regex_only_raises_when_reached(self) -> None:
+        """Test a rule with a bad regex fails inputs that reach it, not every input."""
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            rules = [
+                {
+                    "id": "bad_regex",
+                    "match": {"self": {"text": "行行", "regex": "("}},
+                    "target": {"char": "行", "occurrence": 1},
+                    "choose": "xíng",
+                },
+            ]
+            self._create_data_with_overrides(root, rules)
+            resources = PinyinResources.load_from_dir(root)
+            opts = PinyinizeOptions(resources=resources)
+
+            results = pinyinize("好", opts)
+            self.assertTrue(any("hǎo" in r.output_text for r in results))
+            with self.assertRaises(re.error):
+                pinyinize("行行好", opts)
+
+    def test_rules_changed_after_first_call(self) -> None:
+        """Test rules appended to or edited in overrides_rules after a call are applied."""
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            self._create_data_with_overrides(root, [])
+            resources = PinyinResources.load_from_dir(root)
+            opts = PinyinizeOptions(resources=resources)
+
+            self.assertFalse(any("háng" in r.output_text for r in pinyinize("行", opts)))
+            resources.overrides_rules.append(
+                {
+                    "id": "late",
+                    "match": {"self": {"text": "行"}},
+                    "target": {"char": "行", "occurrence": 1},
+                    "choose": "háng",
+                }
+            )
+            self.assertTrue(all("háng" in r.output_text for r in pinyinize("行", opts)))
+            resources.overrides_rules[-1]["match"]["self"]["text"] = "银行"
+            self.assertFalse(any("háng" in r.output_text for r in pinyinize("行", opts)))
+
 
 class TestReportStructure(unittest.TestCase):
     """Tests for report output structure."""
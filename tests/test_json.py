@@ -0,0 +1,74 @@
+"""Tests for the JSON shim, under both the orjson and the stdlib backend."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+import unittest
+from types import ModuleType
+from typing import Iterator
+from unittest.mock import patch
+
+
+def _load_shim(*, block_orjson: bool) -> ModuleType:
+    """A fresh copy of pinyinize._json; with block_orjson, `import orjson` fails inside it."""
+    spec = importlib.util.find_spec("pinyinize._json")
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    with patch.dict(sys.modules, {"orjson": None} if block_orjson else {}):
+        spec.loader.exec_module(module)
+    return module
+
+
+class TestJsonShim(unittest.TestCase):
+    """Tests that both backends encode and decode alike."""
+
+    def _backends(self) -> Iterator[tuple[str, ModuleType]]:
+        yield "stdlib", _load_shim(block_orjson=True)
+        orjson_shim = _load_shim(block_orjson=False)
+        if orjson_shim.orjson is not None:
+            yield "orjson", orjson_shim
+
+    def test_stdlib_fallback_without_orjson(self) -> None:
+        """Test the shim falls back to the stdlib encoder when orjson cannot be imported."""
+        shim = _load_shim(block_orjson=True)
+        self.assertIsNone(shim.orjson)
+        self.assertIs(shim.dumps, shim._std_dumps)
+        self.assertIs(shim.loads, shim._std_loads)
+
+    def test_dumps(self) -> None:
+        """Test compact and indented output are the same bytes from either backend."""
+        obj = {"word": "银行", "pinyin": ["yín", "háng"], "n": 2, "ok": True, "x": None}
+        for name, shim in self._backends():
+            with self.subTest(backend=name):
+                self.assertEqual(
+                    shim.dumps(obj),
+                    '{"word":"银行","pinyin":["yín","háng"],"n":2,"ok":true,"x":null}'.encode(),
+                )
+                self.assertEqual(
+                    shim.dumps(obj, indent=True),
+                    json.dumps(obj, ensure_ascii=False, indent=2).encode(),
+                )
+
+    def test_loads_accepts_str_bytes_and_memoryview(self) -> None:
+        """Test every input type the loaders pass in decodes to the same value."""
+        raw = '{"char": "行", "pinyin": ["xíng", "háng"], "p": 0.5}'
+        for name, shim in self._backends():
+            with self.subTest(backend=name):
+                for data in (raw, raw.encode(), memoryview(raw.encode())):
+                    self.assertEqual(
+                        shim.loads(data), {"char": "行", "pinyin": ["xíng", "háng"], "p": 0.5}
+                    )
+
+    def test_malformed_input_raises_json_decode_error(self) -> None:
+        """Test both backends raise json.JSONDecodeError on malformed input."""
+        for name, shim in self._backends():
+            with self.subTest(backend=name):
+                with self.assertRaises(json.JSONDecodeError):
+                    shim.loads(b'{"items": [')
+                self.assertIs(shim.JSONDecodeError, json.JSONDecodeError)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,20 +7,32 @@ To run tests against a real Ollama server:
     OLLAMA_HOST=http://localhost:11434 OLLAMA_MODEL=gemma3:1b python -m pytest tests/test_ollama.py -v
 
 To skip tests requiring a real server, set SKIP_LIVE_TESTS=1.
+
+Test classes are independent and safe to spread across pytest-xdist workers. Use
+`python -m pytest -n auto --dist loadscope tests/` so each class stays on one worker
+and TestLiveOllama keeps sharing its adapter and connection pool.
 """
 
 from __future__ import annotations
 
+import http.client
 import json
 import os
-import tempfile
 import unittest
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 from unittest.mock import MagicMock, patch
 
-from pinyinize.core import PinyinizeOptions, pinyinize
-from pinyinize.llm import LLMError, OllamaLLMAdapter, extract_json_object
-from pinyinize.resources import PinyinResources
+from pinyinize.core import PinyinizeOptions, pinyinize, pinyinize_many
+from pinyinize.llm import (
+    _SEGMENT_SYSTEM_PROMPT,
+    LLMError,
+    LLMErrorCode,
+    OllamaLLMAdapter,
+    extract_json_object,
+)
+from tests._fixtures import OLLAMA_DATA_FINGERPRINT, load_resources
+from tests._stubs import StubLLMAdapter
 
 
 # Default test configuration
@@ -29,57 +41,82 @@ DEFAULT_OLLAMA_MODEL = os.environ.get("OLLAMA_MODEL", "gemma3:1b")
 SKIP_LIVE_TESTS = os.environ.get("SKIP_LIVE_TESTS", "0") == "1"
 
 
-class TestExtractJsonObject(unittest.TestCase):
-    """Tests for JSON extraction from LLM responses."""
+def setUpModule() -> None:
+    unittest.addModuleCleanup(load_resources.cache_clear)
+    # Warm-up run: pay one-time initialization here instead of in whichever test runs first.
+    pinyinize("银行", PinyinizeOptions(resources=load_resources(OLLAMA_DATA_FINGERPRINT)))
 
-    def test_direct_json(self) -> None:
-        """Test extracting direct JSON."""
-        text = '{"key": "value", "number": 123}'
-        result = extract_json_object(text)
-        self.assertEqual(result, {"key": "value", "number": 123})
 
-    def test_json_with_code_fence(self) -> None:
-        """Test extracting JSON from markdown code fence."""
-        text = """```json
-{"key": "value"}
+# Canned /api/chat message contents.
+_SEGMENT_CONTENT = '{"schema_version": 1, "spans": [{"span_id": "S0", "tokens": [{"text": "银行", "upos": "NOUN", "xpos": "NN", "ner": "O"}]}]}'
+_FENCED_SEGMENT_CONTENT = """```json
+{
+  "schema_version": 1,
+  "spans": [
+    {
+      "span_id": "S0",
+      "tokens": [
+        {"text": "测试", "upos": "VERB", "xpos": "VV", "ner": "O"}
+      ]
+    }
+  ]
+}
 ```"""
-        result = extract_json_object(text)
-        self.assertEqual(result, {"key": "value"})
-
-    def test_json_with_text_prefix(self) -> None:
-        """Test extracting JSON with text before it."""
-        text = "Here is the result:\n{\"key\": \"value\"}"
-        result = extract_json_object(text)
-        self.assertEqual(result, {"key": "value"})
-
-    def test_json_with_text_suffix(self) -> None:
-        """Test extracting JSON with text after it."""
-        text = '{"key": "value"}\nHope this helps!'
-        result = extract_json_object(text)
-        self.assertEqual(result, {"key": "value"})
-
-    def test_empty_response(self) -> None:
-        """Test error on empty response."""
-        with self.assertRaises(LLMError) as ctx:
-            extract_json_object("")
-        self.assertIn("empty", str(ctx.exception).lower())
+_DOUBLE_CHECK_CONTENT = '{"schema_version": 1, "verdict": "ok", "items": [{"span_id": "S0", "token_index": 0, "char_offset_in_token": 0, "char": "行", "candidates": ["háng", "xíng"], "recommended": "háng", "needs_user": false}]}'
+
+# Canned _http_post_json results (read-only; shared by every test).
+_SEGMENT_RESPONSE = MappingProxyType({"message": {"content": _SEGMENT_CONTENT}})
+_FENCED_SEGMENT_RESPONSE = MappingProxyType({"message": {"content": _FENCED_SEGMENT_CONTENT}})
+_DOUBLE_CHECK_RESPONSE = MappingProxyType({"message": {"content": _DOUBLE_CHECK_CONTENT}})
+_EMPTY_SPANS_RESPONSE = MappingProxyType({"message": {"content": '{"spans": []}'}})
+_NO_MESSAGE_RESPONSE = MappingProxyType({"other": "field"})
+_NO_CONTENT_RESPONSE = MappingProxyType({"message": {"role": "assistant"}})
+
+
+_EXTRACT_CASES = (
+    ("direct", '{"key": "value", "number": 123}', {"key": "value", "number": 123}),
+    ("code_fence", '```json\n{"key": "value"}\n```', {"key": "value"}),
+    ("text_prefix", 'Here is the result:\n{"key": "value"}', {"key": "value"}),
+    ("text_suffix", '{"key": "value"}\nHope this helps!', {"key": "value"}),
+    ("trailing_braces", '{"key": "value"} and {not json}', {"key": "value"}),
+    (
+        "nested",
+        '{"outer": {"inner": [1, 2, 3]}, "flag": true}',
+        {"outer": {"inner": [1, 2, 3]}, "flag": True},
+    ),
+)
+
+_EXTRACT_ERROR_CASES = (
+    ("empty", "", LLMErrorCode.EMPTY_RESPONSE),
+    ("no_object", "not json at all", LLMErrorCode.NO_JSON_OBJECT),
+    ("invalid_object", 'Result: {"key": } done', LLMErrorCode.INVALID_JSON_SNIPPET),
+)
 
-    def test_invalid_json(self) -> None:
-        """Test error on invalid JSON."""
-        with self.assertRaises(LLMError):
-            extract_json_object("not json at all")
 
-    def test_nested_json(self) -> None:
-        """Test extracting nested JSON structure."""
-        text = '{"outer": {"inner": [1, 2, 3]}, "flag": true}'
-        result = extract_json_object(text)
-        self.assertEqual(result["outer"]["inner"], [1, 2, 3])
-        self.assertTrue(result["flag"])
+class TestExtractJsonObject(unittest.TestCase):
+    """Tests for JSON extraction from LLM responses."""
+
+    def test_extract(self) -> None:
+        for name, text, expected in _EXTRACT_CASES:
+            with self.subTest(name=name):
+                self.assertEqual(extract_json_object(text), expected)
+
+    def test_extract_errors(self) -> None:
+        for name, text, code in _EXTRACT_ERROR_CASES:
+            with self.subTest(name=name):
+                with self.assertRaises(LLMError) as ctx:
+                    extract_json_object(text)
+                self.assertIs(ctx.exception.code, code)
 
 
 class TestOllamaLLMAdapter(unittest.TestCase):
     """Tests for OllamaLLMAdapter."""
 
+    def setUp(self) -> None:
+        patcher = patch("pinyinize.llm._http_post_json", autospec=True)
+        self.mock_post = patcher.start()
+        self.addCleanup(patcher.stop)
+
     def test_adapter_creation(self) -> None:
         """Test creating adapter with default host."""
         adapter = OllamaLLMAdapter(model="test-model")
@@ -96,14 +133,9 @@ class TestOllamaLLMAdapter(unittest.TestCase):
         adapter = OllamaLLMAdapter(model="test-model", timeout_s=30.0)
         self.assertEqual(adapter.timeout_s, 30.0)
 
-    @patch("pinyinize.llm._http_post_json")
-    def test_segment_and_tag_success(self, mock_post: MagicMock) -> None:
+    def test_segment_and_tag_success(self) -> None:
         """Test successful segment_and_tag call."""
-        mock_post.return_value = {
-            "message": {
-                "content": '{"schema_version": 1, "spans": [{"span_id": "S0", "tokens": [{"text": "银行", "upos": "NOUN", "xpos": "NN", "ner": "O"}]}]}'
-            }
-        }
+        self.mock_post.return_value = _SEGMENT_RESPONSE
 
         adapter = OllamaLLMAdapter(model="test-model")
         payload = {
@@ -116,26 +148,9 @@ class TestOllamaLLMAdapter(unittest.TestCase):
         self.assertEqual(len(result["spans"]), 1)
         self.assertEqual(result["spans"][0]["span_id"], "S0")
 
-    @patch("pinyinize.llm._http_post_json")
-    def test_segment_and_tag_with_code_fence(self, mock_post: MagicMock) -> None:
+    def test_segment_and_tag_with_code_fence(self) -> None:
         """Test segment_and_tag with markdown code fence response."""
-        mock_post.return_value = {
-            "message": {
-                "content": """```json
-{
-  "schema_version": 1,
-  "spans": [
-    {
-      "span_id": "S0",
-      "tokens": [
-        {"text": "测试", "upos": "VERB", "xpos": "VV", "ner": "O"}
-      ]
-    }
-  ]
-}
-```"""
-            }
-        }
+        self.mock_post.return_value = _FENCED_SEGMENT_RESPONSE
 
         adapter = OllamaLLMAdapter(model="test-model")
         payload = {
@@ -147,14 +162,37 @@ class TestOllamaLLMAdapter(unittest.TestCase):
         self.assertIn("spans", result)
         self.assertEqual(result["spans"][0]["tokens"][0]["text"], "测试")
 
-    @patch("pinyinize.llm._http_post_json")
-    def test_double_check_success(self, mock_post: MagicMock) -> None:
+    @patch("pinyinize.llm._http_post_json_stream")
+    def test_segment_and_tag_stream(self, mock_stream: MagicMock) -> None:
+        """Test segment_and_tag assembling content from NDJSON chunks."""
+        content = _SEGMENT_CONTENT
+        pieces = [content[i : i + 30] for i in range(0, len(content), 30)][:4]
+        pieces.append(content[sum(len(p) for p in pieces) :])
+        mock_stream.return_value = iter(
+            [{"message": {"content": p}, "done": False} for p in pieces[:-1]]
+            + [{"message": {"content": pieces[-1]}, "done": True}]
+        )
+
+        adapter = OllamaLLMAdapter(model="test-model", stream=True)
+        result = adapter.segment_and_tag({"spans": [{"span_id": "S0", "text": "银行"}]})
+
+        self.assertEqual(mock_stream.call_count, 1)
+        self.assertEqual(json.loads(mock_stream.call_args.args[1])["stream"], True)
+        self.assertEqual(result, json.loads(content))
+
+    @patch("pinyinize.llm._http_post_json_stream")
+    def test_stream_without_done(self, mock_stream: MagicMock) -> None:
+        """Test error when the stream ends before the done chunk."""
+        mock_stream.return_value = iter([{"message": {"content": "{"}, "done": False}])
+
+        adapter = OllamaLLMAdapter(model="test-model", stream=True)
+        with self.assertRaises(LLMError) as ctx:
+            adapter.segment_and_tag({"spans": []})
+        self.assertIs(ctx.exception.code, LLMErrorCode.STREAM_INCOMPLETE)
+
+    def test_double_check_success(self) -> None:
         """Test successful double_check call."""
-        mock_post.return_value = {
-            "message": {
-                "content": '{"schema_version": 1, "verdict": "ok", "items": [{"span_id": "S0", "token_index": 0, "char_offset_in_token": 0, "char": "行", "candidates": ["háng", "xíng"], "recommended": "háng", "needs_user": false}]}'
-            }
-        }
+        self.mock_post.return_value = _DOUBLE_CHECK_RESPONSE
 
         adapter = OllamaLLMAdapter(model="test-model")
         payload = {
@@ -168,93 +206,137 @@ class TestOllamaLLMAdapter(unittest.TestCase):
         self.assertIn("items", result)
         self.assertEqual(result["items"][0]["recommended"], "háng")
 
-    @patch("pinyinize.llm._http_post_json")
-    def test_http_error_handling(self, mock_post: MagicMock) -> None:
+    def test_http_error_handling(self) -> None:
         """Test handling of HTTP errors."""
-        mock_post.side_effect = LLMError("ollama_http_error:Connection refused")
+        self.mock_post.side_effect = LLMError(LLMErrorCode.HTTP_ERROR, "Connection refused")
 
         adapter = OllamaLLMAdapter(model="test-model")
         payload = {"spans": []}
 
         with self.assertRaises(LLMError) as ctx:
             adapter.segment_and_tag(payload)
-        self.assertIn("ollama_http_error", str(ctx.exception))
+        self.assertIs(ctx.exception.code, LLMErrorCode.HTTP_ERROR)
+        self.assertEqual(str(ctx.exception), "ollama_http_error:Connection refused")
 
-    @patch("pinyinize.llm._http_post_json")
-    def test_missing_message_field(self, mock_post: MagicMock) -> None:
+    def test_missing_message_field(self) -> None:
         """Test error when message field is missing."""
-        mock_post.return_value = {"other": "field"}
+        self.mock_post.return_value = _NO_MESSAGE_RESPONSE
 
         adapter = OllamaLLMAdapter(model="test-model")
         payload = {"spans": []}
 
         with self.assertRaises(LLMError) as ctx:
             adapter.segment_and_tag(payload)
-        self.assertIn("missing_message", str(ctx.exception))
+        self.assertIs(ctx.exception.code, LLMErrorCode.MISSING_MESSAGE)
 
-    @patch("pinyinize.llm._http_post_json")
-    def test_missing_content_field(self, mock_post: MagicMock) -> None:
+    def test_missing_content_field(self) -> None:
         """Test error when content field is missing."""
-        mock_post.return_value = {"message": {"role": "assistant"}}
+        self.mock_post.return_value = _NO_CONTENT_RESPONSE
 
         adapter = OllamaLLMAdapter(model="test-model")
         payload = {"spans": []}
 
         with self.assertRaises(LLMError) as ctx:
             adapter.segment_and_tag(payload)
-        self.assertIn("missing_content", str(ctx.exception))
+        self.assertIs(ctx.exception.code, LLMErrorCode.MISSING_CONTENT)
 
+    def test_request_body_matches_envelope(self) -> None:
+        """Test that the pre-encoded envelope produces the same body as a full dump."""
+        self.mock_post.return_value = _EMPTY_SPANS_RESPONSE
 
-class TestOllamaWithPinyinize(unittest.TestCase):
-    """Tests for Ollama integration with pinyinize core."""
-
-    def _create_minimal_data(self, root: Path) -> None:
-        """Create minimal test data."""
-        root.joinpath("word.json").write_text(
-            '{"word": "银行", "pinyin": "yín háng"},\n'
-            '{"word": "行长", "pinyin": "háng zhǎng"},\n',
-            encoding="utf-8",
-        )
-        root.joinpath("char_base.json").write_text(
-            '{"index": 1, "char": "银", "pinyin": ["yín"]},\n'
-            '{"index": 2, "char": "行", "pinyin": ["xíng", "háng"]},\n'
-            '{"index": 3, "char": "长", "pinyin": ["cháng", "zhǎng"]},\n',
-            encoding="utf-8",
-        )
-        root.joinpath("polyphone.json").write_text(
-            json.dumps([
-                {"index": 1, "char": "行", "pinyin": ["xíng", "háng"]},
-                {"index": 2, "char": "长", "pinyin": ["cháng", "zhǎng"]},
-            ], ensure_ascii=False) + "\n",
-            encoding="utf-8",
+        adapter = OllamaLLMAdapter(model="test-model")
+        payload = {"spans": [{"span_id": "S0", "text": "银行"}]}
+        adapter.segment_and_tag(payload)
+
+        url, body = self.mock_post.call_args.args
+        self.assertEqual(url, "http://localhost:11434/api/chat")
+        self.assertIsInstance(body, bytes)
+        golden = {
+            "model": "test-model",
+            "stream": False,
+            "messages": [
+                {"role": "system", "content": _SEGMENT_SYSTEM_PROMPT},
+                {"role": "user", "content": json.dumps(payload, ensure_ascii=False, indent=2)},
+            ],
+        }
+        self.assertEqual(
+            body, json.dumps(golden, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
         )
-        root.joinpath("polyphone_disambig.json").write_text(
-            json.dumps({
-                "schema": "test",
-                "thresholds": {"min_support": 5, "min_prob": 0.85, "min_margin": 0.15},
-                "items": [],
-            }, ensure_ascii=False) + "\n",
-            encoding="utf-8",
+
+
+class TestConnectionPool(unittest.TestCase):
+    """Tests for the adapter's keep-alive connection pool."""
+
+    @patch("pinyinize.llm.http.client.HTTPConnection")
+    def test_connection_reused_across_calls(self, mock_conn_cls: MagicMock) -> None:
+        """Test that back-to-back calls share one keep-alive connection."""
+        resp = MagicMock(status=200, will_close=False)
+        resp.read.return_value = (
+            b'{"message": {"content": "{\\"schema_version\\": 1, \\"spans\\": []}"}}'
         )
-        root.joinpath("overrides.json").write_text(
-            json.dumps({"schema_version": 1, "rules": []}, ensure_ascii=False) + "\n",
-            encoding="utf-8",
+        mock_conn_cls.return_value.getresponse.return_value = resp
+
+        adapter = OllamaLLMAdapter(model="test-model")
+        adapter.segment_and_tag({"spans": []})
+        adapter.segment_and_tag({"spans": []})
+        adapter.close()
+
+        mock_conn_cls.assert_called_once_with("localhost:11434", timeout=60.0)
+        conn = mock_conn_cls.return_value
+        self.assertEqual(conn.request.call_count, 2)
+        self.assertEqual(conn.request.call_args.args[:2], ("POST", "/api/chat"))
+        conn.close.assert_called_once()
+
+    @patch("pinyinize.llm.http.client.HTTPConnection")
+    def test_timeout_on_reused_connection_not_resent(self, mock_conn_cls: MagicMock) -> None:
+        """Test that a timeout on a kept-alive connection raises without sending the request again."""
+        resp = MagicMock(status=200, will_close=False)
+        resp.read.return_value = (
+            b'{"message": {"content": "{\\"schema_version\\": 1, \\"spans\\": []}"}}'
         )
-        root.joinpath("lexicon.json").write_text(
-            json.dumps({"schema_version": 1, "items": []}, ensure_ascii=False) + "\n",
-            encoding="utf-8",
+        conn = mock_conn_cls.return_value
+        conn.getresponse.side_effect = [resp, TimeoutError("timed out")]
+
+        adapter = OllamaLLMAdapter(model="test-model")
+        adapter.segment_and_tag({"spans": []})
+        with self.assertRaises(LLMError) as ctx:
+            adapter.segment_and_tag({"spans": []})
+        adapter.close()
+
+        self.assertIs(ctx.exception.code, LLMErrorCode.HTTP_ERROR)
+        mock_conn_cls.assert_called_once()
+        self.assertEqual(conn.request.call_count, 2)
+
+    @patch("pinyinize.llm.http.client.HTTPConnection")
+    def test_stale_connection_retried(self, mock_conn_cls: MagicMock) -> None:
+        """Test that a kept-alive connection closed by the server is retried on a fresh one."""
+        resp = MagicMock(status=200, will_close=False)
+        resp.read.return_value = (
+            b'{"message": {"content": "{\\"schema_version\\": 1, \\"spans\\": []}"}}'
         )
+        conn = mock_conn_cls.return_value
+        conn.getresponse.side_effect = [resp, http.client.RemoteDisconnected("closed"), resp]
+
+        adapter = OllamaLLMAdapter(model="test-model")
+        adapter.segment_and_tag({"spans": []})
+        adapter.segment_and_tag({"spans": []})
+        adapter.close()
+
+        self.assertEqual(mock_conn_cls.call_count, 2)
+        self.assertEqual(conn.request.call_count, 3)
+
+
+class TestOllamaWithPinyinize(unittest.TestCase):
+    """Tests for Ollama integration with pinyinize core."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._resources = load_resources(OLLAMA_DATA_FINGERPRINT)
 
     def test_pinyinize_with_mock_llm(self) -> None:
         """Test pinyinize with mock LLM adapter."""
-        with tempfile.TemporaryDirectory() as td:
-            root = Path(td)
-            self._create_minimal_data(root)
-            resources = PinyinResources.load_from_dir(root)
-
-            # Create mock LLM adapter
-            mock_adapter = MagicMock()
-            mock_adapter.segment_and_tag.return_value = {
+        adapter = StubLLMAdapter(
+            seg_response={
                 "schema_version": 1,
                 "spans": [
                     {
@@ -266,42 +348,101 @@ class TestOllamaWithPinyinize(unittest.TestCase):
                     }
                 ],
             }
+        )
+
+        opts = PinyinizeOptions(
+            resources=self._resources,
+            llm_adapter=adapter,
+        )
+        results = pinyinize("银行行长", opts)
+
+        self.assertTrue(any(r.output_text == "yínháng hángzhǎng" for r in results))
+        expected_payload = {
+            "schema_version": 1,
+            "task": "segment_and_tag",
+            "tagset": {"upos": "UDv2", "xpos": "CTB", "ner": "CoNLL"},
+            "spans": [{"span_id": "S0", "text": "银行行长"}],
+        }
+        self.assertEqual(adapter.calls, [("segment_and_tag", expected_payload)])
+
+    def test_pinyinize_many_batches_llm_calls(self) -> None:
+        """Test pinyinize_many sends one segment_and_tag request per batch of texts."""
+        segmentation = {"银行": ["银行"], "行长": ["行长"], "银行行长": ["银行", "行长"]}
+
+        def segment_and_tag(payload: dict) -> dict:
+            return {
+                "spans": [
+                    {
+                        "span_id": sp["span_id"],
+                        "tokens": [
+                            {"text": t, "upos": "NOUN", "xpos": "NN", "ner": "O"}
+                            for t in segmentation[sp["text"]]
+                        ],
+                    }
+                    for sp in payload["spans"]
+                ],
+                "warnings": [f"{sp['span_id']}: checked" for sp in payload["spans"]]
+                + [{"span_id": payload["spans"][-1]["span_id"], "message": "tagged"}, "batch-wide note"],
+            }
 
-            opts = PinyinizeOptions(
-                resources=resources,
-                llm_adapter=mock_adapter,
-            )
-            results = pinyinize("银行行长", opts)
+        adapter = StubLLMAdapter(seg_response=segment_and_tag)
+
+        opts = PinyinizeOptions(
+            resources=self._resources,
+            llm_adapter=adapter,
+            llm_batch_size=2,
+        )
+        all_results = pinyinize_many(["银行", "行长", "银行行长"], opts)
 
-            self.assertTrue(any(r.output_text == "yínháng hángzhǎng" for r in results))
-            mock_adapter.segment_and_tag.assert_called_once()
+        self.assertEqual([name for name, _ in adapter.calls], ["segment_and_tag"] * 2)
+        self.assertEqual(
+            [results[0].output_text for results in all_results],
+            ["yínháng", "hángzhǎng", "yínháng hángzhǎng"],
+        )
+        for results in all_results:
+            meta = results[0].report["llm_segment_and_tag"]
+            self.assertTrue(meta["batched"])
+            self.assertEqual(meta["invalid_spans"], [])
+            self.assertEqual(meta["batch"]["warnings"], ["batch-wide note"])
+
+        # Each text reports the request that was actually sent for its batch.
+        metas = [results[0].report["llm_segment_and_tag"] for results in all_results]
+        sent = [payload for _, payload in adapter.calls]
+        self.assertEqual([m["request"] for m in metas], [sent[0], sent[0], sent[1]])
+        self.assertEqual([m["batch"]["texts"] for m in metas], [[0, 1], [0, 1], [2]])
+
+        # Warnings go only to the text they name, with the batch prefix stripped.
+        self.assertEqual(metas[0]["response"]["warnings"], ["S0: checked"])
+        self.assertEqual(
+            metas[1]["response"]["warnings"],
+            ["S0: checked", {"span_id": "S0", "message": "tagged"}],
+        )
+        self.assertEqual(
+            metas[2]["response"]["warnings"],
+            ["S0: checked", {"span_id": "S0", "message": "tagged"}],
+        )
 
     def test_pinyinize_llm_fallback_on_invalid_response(self) -> None:
         """Test fallback when LLM returns invalid response."""
-        with tempfile.TemporaryDirectory() as td:
-            root = Path(td)
-            self._create_minimal_data(root)
-            resources = PinyinResources.load_from_dir(root)
-
-            # Create mock LLM adapter that returns invalid response
-            mock_adapter = MagicMock()
-            mock_adapter.segment_and_tag.return_value = {
-                "invalid": "response"  # Missing spans
-            }
+        adapter = StubLLMAdapter(seg_response={"invalid": "response"})  # Missing spans
 
-            opts = PinyinizeOptions(
-                resources=resources,
-                llm_adapter=mock_adapter,
-            )
-            results = pinyinize("银行行长", opts)
-            result = results[0]
+        opts = PinyinizeOptions(
+            resources=self._resources,
+            llm_adapter=adapter,
+        )
+        results = pinyinize("银行行长", opts)
+        result = results[0]
 
-            # Should still produce output using fallback
-            self.assertIn("yín", result.output_text)
-            self.assertIn("háng", result.output_text)
+        # Should still produce output using fallback
+        self.assertIn("yín", result.output_text)
+        self.assertIn("háng", result.output_text)
 
-            # Report should indicate error occurred (not invalid_spans since there was an error)
-            self.assertIn("error", result.report["llm_segment_and_tag"])
+        # Report should indicate error occurred (not invalid_spans since there was an error)
+        meta = result.report["llm_segment_and_tag"]
+        self.assertIn("error", meta)
+        # A malformed response skips per-span validation entirely.
+        self.assertTrue(meta["fallback_fast_path"])
+        self.assertNotIn("invalid_spans", meta)
 
     def test_pinyinize_with_double_check(self) -> None:
         """Test pinyinize with double-check LLM adapter.
@@ -309,63 +450,53 @@ class TestOllamaWithPinyinize(unittest.TestCase):
         Note: Double check is only triggered when there are review items
         (low confidence, needs_review flags, or conflicts).
         """
-        with tempfile.TemporaryDirectory() as td:
-            root = Path(td)
-            self._create_minimal_data(root)
-            resources = PinyinResources.load_from_dir(root)
-
-            mock_adapter = MagicMock()
-            mock_adapter.segment_and_tag.return_value = {
-                "schema_version": 1,
-                "spans": [
-                    {
-                        "span_id": "S0",
-                        "tokens": [
-                            # Use a word NOT in the dictionary to create ambiguity
-                            {"text": "行", "upos": "NOUN", "xpos": "NN", "ner": "O"},
-                        ],
-                    }
-                ],
-            }
-            mock_adapter.double_check.return_value = {
-                "schema_version": 1,
-                "verdict": "ok",
-                "items": [
-                    {
-                        "span_id": "S0",
-                        "token_index": 0,
-                        "char_offset_in_token": 0,
-                        "char": "行",
-                        "recommended": "háng",
-                        "needs_user": False,
-                    }
-                ],
-            }
+        mock_adapter = MagicMock()
+        mock_adapter.segment_and_tag.return_value = {
+            "schema_version": 1,
+            "spans": [
+                {
+                    "span_id": "S0",
+                    "tokens": [
+                        # Use a word NOT in the dictionary to create ambiguity
+                        {"text": "行", "upos": "NOUN", "xpos": "NN", "ner": "O"},
+                    ],
+                }
+            ],
+        }
+        mock_adapter.double_check.return_value = {
+            "schema_version": 1,
+            "verdict": "ok",
+            "items": [
+                {
+                    "span_id": "S0",
+                    "token_index": 0,
+                    "char_offset_in_token": 0,
+                    "char": "行",
+                    "recommended": "háng",
+                    "needs_user": False,
+                }
+            ],
+        }
 
-            opts = PinyinizeOptions(
-                resources=resources,
-                llm_adapter=mock_adapter,
-                double_check_adapter=mock_adapter,
-                double_check_threshold=0.9,
-            )
-            pinyinize("行", opts)
+        opts = PinyinizeOptions(
+            resources=self._resources,
+            llm_adapter=mock_adapter,
+            double_check_adapter=mock_adapter,
+            double_check_threshold=0.9,
+        )
+        pinyinize("行", opts)
 
-            # Double check should be called because 行 is a polyphone with low confidence
-            mock_adapter.double_check.assert_called_once()
+        # Double check should be called because 行 is a polyphone with low confidence
+        mock_adapter.double_check.assert_called_once()
 
     def test_pinyinize_without_llm(self) -> None:
         """Test pinyinize without LLM adapter (fallback mode)."""
-        with tempfile.TemporaryDirectory() as td:
-            root = Path(td)
-            self._create_minimal_data(root)
-            resources = PinyinResources.load_from_dir(root)
-
-            opts = PinyinizeOptions(resources=resources, llm_adapter=None)
-            results = pinyinize("银行行长", opts)
-            result = results[0]
+        opts = PinyinizeOptions(resources=self._resources, llm_adapter=None)
+        results = pinyinize("银行行长", opts)
+        result = results[0]
 
-            self.assertEqual(result.output_text, "yínháng hángzhǎng")
-            self.assertFalse(result.report["llm_segment_and_tag"]["used"])
+        self.assertEqual(result.output_text, "yínháng hángzhǎng")
+        self.assertFalse(result.report["llm_segment_and_tag"]["used"])
 
 
 @unittest.skipIf(SKIP_LIVE_TESTS, "Skipping live Ollama tests")
@@ -379,50 +510,23 @@ class TestLiveOllama(unittest.TestCase):
     To skip: set SKIP_LIVE_TESTS=1
     """
 
-    def _create_minimal_data(self, root: Path) -> None:
-        """Create minimal test data."""
-        root.joinpath("word.json").write_text(
-            "",
-            encoding="utf-8",
-        )
-        root.joinpath("char_base.json").write_text(
-            '{"index": 1, "char": "测", "pinyin": ["cè"]},\n'
-            '{"index": 2, "char": "试", "pinyin": ["shì"]},\n'
-            '{"index": 3, "char": "银", "pinyin": ["yín"]},\n'
-            '{"index": 4, "char": "行", "pinyin": ["xíng", "háng"]},\n',
-            encoding="utf-8",
-        )
-        root.joinpath("polyphone.json").write_text(
-            json.dumps([
-                {"index": 1, "char": "行", "pinyin": ["xíng", "háng"]},
-            ], ensure_ascii=False) + "\n",
-            encoding="utf-8",
-        )
-        root.joinpath("polyphone_disambig.json").write_text(
-            json.dumps({
-                "schema": "test",
-                "thresholds": {"min_support": 5, "min_prob": 0.85, "min_margin": 0.15},
-                "items": [],
-            }, ensure_ascii=False) + "\n",
-            encoding="utf-8",
-        )
-        root.joinpath("overrides.json").write_text(
-            json.dumps({"schema_version": 1, "rules": []}, ensure_ascii=False) + "\n",
-            encoding="utf-8",
-        )
-        root.joinpath("lexicon.json").write_text(
-            json.dumps({"schema_version": 1, "items": []}, ensure_ascii=False) + "\n",
-            encoding="utf-8",
-        )
-
-    def test_live_segment_and_tag(self) -> None:
-        """Test live Ollama segment_and_tag API."""
-        adapter = OllamaLLMAdapter(
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._resources = load_resources(OLLAMA_DATA_FINGERPRINT)
+        cls._adapter = OllamaLLMAdapter(
             model=DEFAULT_OLLAMA_MODEL,
             host=DEFAULT_OLLAMA_HOST,
             timeout_s=60.0,
         )
 
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._adapter.close()
+
+    def test_live_segment_and_tag(self) -> None:
+        """Test live Ollama segment_and_tag API."""
+        adapter = self._adapter
+
         payload = {
             "schema_version": 1,
             "task": "segment_and_tag",
@@ -438,11 +542,7 @@ class TestLiveOllama(unittest.TestCase):
 
     def test_live_double_check(self) -> None:
         """Test live Ollama double_check API."""
-        adapter = OllamaLLMAdapter(
-            model=DEFAULT_OLLAMA_MODEL,
-            host=DEFAULT_OLLAMA_HOST,
-            timeout_s=60.0,
-        )
+        adapter = self._adapter
 
         payload = {
             "schema_version": 1,
@@ -475,29 +575,42 @@ class TestLiveOllama(unittest.TestCase):
 
     def test_live_end_to_end(self) -> None:
         """Test end-to-end pinyinize with live Ollama."""
-        with tempfile.TemporaryDirectory() as td:
-            root = Path(td)
-            self._create_minimal_data(root)
-            resources = PinyinResources.load_from_dir(root)
-
-            adapter = OllamaLLMAdapter(
-                model=DEFAULT_OLLAMA_MODEL,
-                host=DEFAULT_OLLAMA_HOST,
-                timeout_s=60.0,
-            )
-
-            opts = PinyinizeOptions(
-                resources=resources,
-                llm_adapter=adapter,
-                double_check_adapter=None,  # Skip double check for this test
-            )
-
-            try:
-                results = pinyinize("测试", opts)
-                self.assertTrue(any(r.output_text for r in results))
-                self.assertTrue(any(r.report["llm_segment_and_tag"]["used"] for r in results))
-            except Exception as e:
-                self.skipTest(f"Ollama server not available: {e}")
+        adapter = self._adapter
+
+        opts = PinyinizeOptions(
+            resources=self._resources,
+            llm_adapter=adapter,
+            double_check_adapter=None,  # Skip double check for this test
+        )
+
+        try:
+            results = pinyinize("测试", opts)
+            self.assertTrue(any(r.output_text for r in results))
+            self.assertTrue(any(r.report["llm_segment_and_tag"]["used"] for r in results))
+        except Exception as e:
+            self.skipTest(f"Ollama server not available: {e}")
+
+    def test_live_concurrent_end_to_end(self) -> None:
+        """Test concurrent pinyinize calls sharing one adapter (server-side batching)."""
+        opts = PinyinizeOptions(
+            resources=self._resources,
+            llm_adapter=self._adapter,
+            double_check_adapter=None,
+        )
+        texts = [f"测试{i}" for i in range(4)]
+
+        try:
+            with ThreadPoolExecutor(max_workers=len(texts)) as pool:
+                all_results = list(pool.map(lambda t: pinyinize(t, opts), texts))
+        except Exception as e:
+            self.skipTest(f"Ollama server not available: {e}")
+
+        for text, results in zip(texts, all_results):
+            meta = results[0].report["llm_segment_and_tag"]
+            if "error" in meta:
+                self.skipTest(f"Ollama server not available: {meta['error']}")
+            self.assertIn("cè", results[0].output_text, text)
+            self.assertIn("shì", results[0].output_text, text)
 
 
 if __name__ == "__main__":
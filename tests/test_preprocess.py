@@ -2,17 +2,25 @@
 
 from __future__ import annotations
 
+import unicodedata
 import unittest
 
-from pinyinize.preprocess import split_spans
+from pinyinize.preprocess import split_spans, split_spans_batch
 from pinyinize.types import Span
 from pinyinize.util import (
+    HAN_BIT,
+    HAN_RANGES,
+    PUNCT_BIT,
+    SPACE_BIT,
+    char_class,
     is_ascii_digit,
     is_ascii_letter,
     is_han,
+    is_han_text,
     is_punct_or_symbol,
     is_space,
     is_word_like_protected_kind,
+    normalize_pinyin,
     normalize_word_pinyin,
 )
 
@@ -51,19 +59,26 @@ class TestIsHan(unittest.TestCase):
         self.assertFalse(is_han("，"))
         self.assertFalse(is_han("！"))
 
+    def test_han_text(self) -> None:
+        """Test is_han_text agrees with is_han over every character."""
+        for text in ("银行", "㐀𠀀", "", "API接口", "银 行", "银行。", "OpenAI"):
+            with self.subTest(text=text):
+                self.assertEqual(is_han_text(text), bool(text) and all(is_han(ch) for ch in text))
+
 
 class TestIsAsciiLetter(unittest.TestCase):
     """Tests for ASCII letter detection."""
 
     def test_lowercase(self) -> None:
         """Test lowercase letters."""
-        for c in "abcdefghijklmnopqrstuvwxyz":
-            self.assertTrue(is_ascii_letter(c), f"'{c}' should be ASCII letter")
+        chars = "abcdefghijklmnopqrstuvwxyz"
+        # Keyed by character so a failure diff names the offending one.
+        self.assertEqual({c: is_ascii_letter(c) for c in chars}, dict.fromkeys(chars, True))
 
     def test_uppercase(self) -> None:
         """Test uppercase letters."""
-        for c in "ABCDEFGHIJKLMNOPQRSTUVWXYZ":
-            self.assertTrue(is_ascii_letter(c), f"'{c}' should be ASCII letter")
+        chars = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+        self.assertEqual({c: is_ascii_letter(c) for c in chars}, dict.fromkeys(chars, True))
 
     def test_non_letters(self) -> None:
         """Test non-letters are not ASCII letters."""
@@ -78,8 +93,8 @@ class TestIsAsciiDigit(unittest.TestCase):
 
     def test_digits(self) -> None:
         """Test all ASCII digits."""
-        for c in "0123456789":
-            self.assertTrue(is_ascii_digit(c), f"'{c}' should be ASCII digit")
+        chars = "0123456789"
+        self.assertEqual({c: is_ascii_digit(c) for c in chars}, dict.fromkeys(chars, True))
 
     def test_non_digits(self) -> None:
         """Test non-digits are not ASCII digits."""
@@ -149,6 +164,55 @@ class TestIsPunctOrSymbol(unittest.TestCase):
         self.assertFalse(is_punct_or_symbol("0"))
 
 
+def _range_check_class(cp: int) -> tuple[bool, bool, bool]:
+    """(han, space, punct/symbol) as computed before the class table existed."""
+    ch = chr(cp)
+    han = (
+        (0x3400 <= cp <= 0x4DBF)
+        or (0x4E00 <= cp <= 0x9FFF)
+        or (0xF900 <= cp <= 0xFAFF)
+        or (0x20000 <= cp <= 0x2A6DF)
+        or (0x2A700 <= cp <= 0x2B73F)
+        or (0x2B740 <= cp <= 0x2B81F)
+        or (0x2B820 <= cp <= 0x2CEAF)
+        or (0x2CEB0 <= cp <= 0x2EBEF)
+    )
+    cat = unicodedata.category(ch)
+    return han, ch.isspace(), cat.startswith("P") or cat.startswith("S")
+
+
+class TestCharClass(unittest.TestCase):
+    """Tests for the two-level character class table."""
+
+    def test_matches_range_checks(self) -> None:
+        """Test table bits match the old range checks at Han range edges and in every BMP block."""
+        probes = {cp for lo, hi in HAN_RANGES for cp in (lo - 1, lo, hi, hi + 1)}
+        probes.update((block << 7) | (block * 53 & 127) for block in range(0x10000 >> 7))
+        for cp in sorted(probes):
+            bits = char_class(chr(cp))
+            self.assertEqual(
+                (bool(bits & HAN_BIT), bool(bits & SPACE_BIT), bool(bits & PUNCT_BIT)),
+                _range_check_class(cp),
+                hex(cp),
+            )
+
+    def test_han_range_edges(self) -> None:
+        """Test Han bit at the edges of the CJK ranges, including supplementary planes."""
+        for cp, expected in (
+            (0x33FF, False),
+            (0x3400, True),
+            (0x4DBF, True),
+            (0x4DC0, False),
+            (0x9FFF, True),
+            (0xF900, True),
+            (0x1FFFF, False),
+            (0x20000, True),
+            (0x2EBEF, True),
+            (0x2EBF0, False),
+        ):
+            self.assertEqual(bool(char_class(chr(cp)) & HAN_BIT), expected, hex(cp))
+
+
 class TestSplitSpans(unittest.TestCase):
     """Tests for span splitting."""
 
@@ -163,6 +227,18 @@ class TestSplitSpans(unittest.TestCase):
         self.assertEqual(spans[0].start, 0)
         self.assertEqual(spans[0].end, 4)
 
+    def test_unicode_whitespace_run(self) -> None:
+        """Test every str.isspace() character joins one space span and ends URLs."""
+        # U+3000 is the highest str.isspace() code point.
+        spaces = "".join(chr(cp) for cp in range(0x3001) if chr(cp).isspace())
+        spans = split_spans("a" + spaces + "b")
+        self.assertEqual([sp.kind for sp in spans], ["latin", "space", "latin"])
+        self.assertEqual(spans[1].text, spaces)
+
+        for ch in spaces:
+            spans = split_spans(f"http://x{ch}y")
+            self.assertEqual(spans[0].text, "http://x", hex(ord(ch)))
+
     def test_chinese_with_punctuation(self) -> None:
         """Test Chinese with punctuation."""
         text = "你好，世界。"
@@ -306,6 +382,43 @@ class TestSplitSpans(unittest.TestCase):
         self.assertIn("0", texts)
         self.assertIn("https://openai.com", texts)
 
+    def test_long_document_spans_are_contiguous(self) -> None:
+        """Test a ~100k-char document splits into contiguous spans matching a short input's."""
+        unit = "OpenAI的API v2.0：https://openai.com 银行行长重新营业，他得去得到答案。\n"
+        unit_spans = split_spans(unit)
+        text = unit * (100_000 // len(unit))
+        spans = split_spans(text)
+
+        self.assertEqual(len(spans), len(unit_spans) * (len(text) // len(unit)))
+        cursor = 0
+        for idx, sp in enumerate(spans):
+            self.assertEqual(sp.span_id, f"S{idx}")
+            self.assertEqual(sp.start, cursor)
+            self.assertEqual(sp.text, text[sp.start : sp.end])
+            cursor = sp.end
+        self.assertEqual(cursor, len(text))
+        self.assertEqual(
+            [(sp.type, sp.kind, sp.text) for sp in spans[: len(unit_spans)]],
+            [(sp.type, sp.kind, sp.text) for sp in unit_spans],
+        )
+
+    def test_repeated_short_input_returns_fresh_list(self) -> None:
+        """Test cached short inputs still give each caller its own list."""
+        first = split_spans("银行 OK")
+        first.append(first[0])
+        second = split_spans("银行 OK")
+
+        self.assertEqual(len(second), 3)
+        self.assertIsNot(first, second)
+
+    def test_batch_matches_per_text(self) -> None:
+        """Test split_spans_batch returns split_spans for each text, in order."""
+        texts = ["银行行长", "", "OpenAI的API v2.0", "https://example.com 测试", "银行行长"]
+        expected = [split_spans(t) for t in texts]
+
+        self.assertEqual(split_spans_batch(texts), expected)
+        self.assertEqual(split_spans_batch([]), [])
+
     def test_span_ids_sequential(self) -> None:
         """Test that span IDs are sequential."""
         text = "a中b"
@@ -351,6 +464,11 @@ class TestNormalizeWordPinyin(unittest.TestCase):
         self.assertEqual(normalize_word_pinyin("nü han"), "nühan")
         self.assertEqual(normalize_word_pinyin("nv hai"), "nühai")
 
+    def test_normalize_ipa_g(self) -> None:
+        """Test IPA 'ɡ' (U+0261) is normalized to ASCII 'g'."""
+        self.assertEqual(normalize_word_pinyin("ɡuó jiā"), "guójiā")
+        self.assertEqual(normalize_pinyin("ɡuó jiā"), "guó jiā")
+
 
 class TestIsWordLikeProtectedKind(unittest.TestCase):
     """Tests for word-like protected kind detection."""
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import io
 import json
+import pickle
 import tempfile
 import unittest
 from pathlib import Path
+from typing import Any
 
 from pinyinize.resources import (
+    _CACHE_VERSION,
     PinyinResources,
     _load_char_base,
     _load_lexicon,
@@ -18,78 +22,82 @@ from pinyinize.resources import (
 )
 
 
+def _src(text: str) -> io.BytesIO:
+    """In-memory stand-in for a resource file."""
+    return io.BytesIO(text.encode("utf-8"))
+
+
 class TestLoadWordPinyinMap(unittest.TestCase):
     """Tests for _load_word_pinyin_map function."""
 
     def test_load_valid_words(self) -> None:
         """Test loading valid word-pinyin mappings."""
-        with tempfile.TemporaryDirectory() as td:
-            path = Path(td) / "word.json"
-            # Write as JSONL/streaming format (one object per line)
-            path.write_text(
-                '{"word": "银行", "pinyin": "yín háng"},\n'
-                '{"word": "中国", "pinyin": "zhōng guó"},\n',
-                encoding="utf-8",
-            )
-            result = _load_word_pinyin_map(path)
-            self.assertEqual(result["银行"], "yín háng")
-            self.assertEqual(result["中国"], "zhōng guó")
+        # JSONL/streaming format (one object per line)
+        src = _src(
+            '{"word": "银行", "pinyin": "yín háng"},\n'
+            '{"word": "中国", "pinyin": "zhōng guó"},\n',
+        )
+        result = _load_word_pinyin_map(src)
+        self.assertEqual(result["银行"], "yín háng")
+        self.assertEqual(result["中国"], "zhōng guó")
 
     def test_skip_non_han_words(self) -> None:
         """Test that words with non-Han characters are skipped."""
-        with tempfile.TemporaryDirectory() as td:
-            path = Path(td) / "word.json"
-            path.write_text(
-                '{"word": "银行", "pinyin": "yín háng"},\n'
-                '{"word": "OpenAI", "pinyin": "OpenAI"},\n'
-                '{"word": "API接口", "pinyin": "API jiē kǒu"},\n',
-                encoding="utf-8",
-            )
-            result = _load_word_pinyin_map(path)
-            self.assertIn("银行", result)
-            self.assertNotIn("OpenAI", result)
-            self.assertNotIn("API接口", result)
+        src = _src(
+            '{"word": "银行", "pinyin": "yín háng"},\n'
+            '{"word": "OpenAI", "pinyin": "OpenAI"},\n'
+            '{"word": "API接口", "pinyin": "API jiē kǒu"},\n',
+        )
+        result = _load_word_pinyin_map(src)
+        self.assertIn("银行", result)
+        self.assertNotIn("OpenAI", result)
+        self.assertNotIn("API接口", result)
 
     def test_skip_empty_word(self) -> None:
         """Test that empty words are skipped."""
-        with tempfile.TemporaryDirectory() as td:
-            path = Path(td) / "word.json"
-            path.write_text(
-                '{"word": "", "pinyin": ""},\n'
-                '{"word": "银行", "pinyin": "yín háng"},\n',
-                encoding="utf-8",
-            )
-            result = _load_word_pinyin_map(path)
-            self.assertNotIn("", result)
-            self.assertIn("银行", result)
+        src = _src(
+            '{"word": "", "pinyin": ""},\n'
+            '{"word": "银行", "pinyin": "yín háng"},\n',
+        )
+        result = _load_word_pinyin_map(src)
+        self.assertNotIn("", result)
+        self.assertIn("银行", result)
 
     def test_skip_invalid_json(self) -> None:
         """Test that lines with invalid JSON raise exception (current behavior)."""
-        with tempfile.TemporaryDirectory() as td:
-            path = Path(td) / "word.json"
-            path.write_text(
-                '{"word": "银行", "pinyin": "yín háng"},\n'
-                'invalid json line,\n'
-                '{"word": "中国", "pinyin": "zhōng guó"},\n',
-                encoding="utf-8",
-            )
-            # Current implementation raises exception on invalid JSON
-            # This is acceptable behavior - invalid data should be fixed
-            with self.assertRaises(json.JSONDecodeError):
-                _load_word_pinyin_map(path)
+        src = _src(
+            '{"word": "银行", "pinyin": "yín háng"},\n'
+            'invalid json line,\n'
+            '{"word": "中国", "pinyin": "zhōng guó"},\n',
+        )
+        # Current implementation raises exception on invalid JSON
+        # This is acceptable behavior - invalid data should be fixed
+        with self.assertRaises(json.JSONDecodeError):
+            _load_word_pinyin_map(src)
 
     def test_streaming_json_lines(self) -> None:
         """Test loading streaming JSON lines format."""
-        with tempfile.TemporaryDirectory() as td:
-            path = Path(td) / "word.json"
-            path.write_text(
-                "{\"word\": \"银行\", \"pinyin\": \"yín háng\"},\n"
-                "{\"word\": \"中国\", \"pinyin\": \"zhōng guó\"},\n",
-                encoding="utf-8",
-            )
-            result = _load_word_pinyin_map(path)
-            self.assertIn("银行", result)
-            self.assertIn("中国", result)
+        src = _src(
+            "{\"word\": \"银行\", \"pinyin\": \"yín háng\"},\n"
+            "{\"word\": \"中国\", \"pinyin\": \"zhōng guó\"},\n",
+        )
+        result = _load_word_pinyin_map(src)
+        self.assertIn("银行", result)
+        self.assertIn("中国", result)
+
+    def test_json_array_layout(self) -> None:
+        """Test word.json as a JSON array, with and without a trailing comma."""
+        for text in (
+            '[\n{"word": "银行", "pinyin": "yín háng"},\n{"word": "中国", "pinyin": "zhōng guó"}\n]\n',
+            '[\n{"word": "银行", "pinyin": "yín háng"},\n{"word": "中国", "pinyin": "zhōng guó"},\n]\n',
+        ):
+            with self.subTest(text=text):
+                result = _load_word_pinyin_map(_src(text))
+                self.assertEqual(result, {"银行": "yín háng", "中国": "zhōng guó"})
+
+    def test_empty_file(self) -> None:
+        """Test an empty word.json loads as an empty map."""
+        self.assertEqual(_load_word_pinyin_map(_src("")), {})
 
 
 class TestLoadCharBase(unittest.TestCase):
@@ -97,32 +105,37 @@ class TestLoadCharBase(unittest.TestCase):
 
     def test_load_valid_chars(self) -> None:
         """Test loading valid character-pinyin mappings."""
-        with tempfile.TemporaryDirectory() as td:
-            path = Path(td) / "char_base.json"
-            # Write as JSONL format
-            path.write_text(
-                '{"index": 1, "char": "中", "pinyin": ["zhōng", "zhòng"]},\n'
-                '{"index": 2, "char": "国", "pinyin": ["guó"]},\n',
-                encoding="utf-8",
-            )
-            result = _load_char_base(path)
-            self.assertEqual(result["中"], ["zhōng", "zhòng"])
-            self.assertEqual(result["国"], ["guó"])
+        # JSONL format
+        src = _src(
+            '{"index": 1, "char": "中", "pinyin": ["zhōng", "zhòng"]},\n'
+            '{"index": 2, "char": "国", "pinyin": ["guó"]},\n',
+        )
+        result = _load_char_base(src)
+        self.assertEqual(result["中"], ("zhōng", "zhòng"))
+        self.assertEqual(result["国"], ("guó",))
 
     def test_skip_invalid_entries(self) -> None:
         """Test that invalid entries are skipped."""
-        with tempfile.TemporaryDirectory() as td:
-            path = Path(td) / "char_base.json"
-            path.write_text(
-                '{"index": 1, "char": "中", "pinyin": ["zhōng"]},\n'
-                '{"index": 2, "char": "国"},\n'  # Missing pinyin
-                '{"index": 3, "pinyin": ["guó"]},\n',  # Missing char
-                encoding="utf-8",
-            )
-            result = _load_char_base(path)
-            self.assertIn("中", result)
-            self.assertNotIn("国", result)
-            self.assertNotIn("guó", result)
+        src = _src(
+            '{"index": 1, "char": "中", "pinyin": ["zhōng"]},\n'
+            '{"index": 2, "char": "国"},\n'  # Missing pinyin
+            '{"index": 3, "pinyin": ["guó"]},\n',  # Missing char
+        )
+        result = _load_char_base(src)
+        self.assertIn("中", result)
+        self.assertNotIn("国", result)
+        self.assertNotIn("guó", result)
+
+    def test_repeated_syllables_are_shared(self) -> None:
+        """Test equal syllables across entries are stored as one string object."""
+        src = _src(
+            '{"index": 1, "char": "中", "pinyin": ["zhōng", "zhòng"]},\n'
+            '{"index": 2, "char": "钟", "pinyin": ["zhōng"]},\n',
+        )
+        pool: dict[str, str] = {}
+        result = _load_char_base(src, pool)
+        self.assertIs(result["中"][0], result["钟"][0])
+        self.assertEqual(sorted(pool), ["zhòng", "zhōng"])
 
 
 class TestLoadPolyphoneCandidates(unittest.TestCase):
@@ -130,98 +143,86 @@ class TestLoadPolyphoneCandidates(unittest.TestCase):
 
     def test_load_valid(self) -> None:
         """Test loading valid polyphone candidates."""
-        with tempfile.TemporaryDirectory() as td:
-            path = Path(td) / "polyphone.json"
-            path.write_text(
-                json.dumps([
-                    {"index": 1, "char": "中", "pinyin": ["zhōng", "zhòng"]},
-                    {"index": 2, "char": "长", "pinyin": ["cháng", "zhǎng"]},
-                ], ensure_ascii=False),
-                encoding="utf-8",
-            )
-            result = _load_polyphone_candidates(path)
-            self.assertEqual(result["中"], ["zhōng", "zhòng"])
-            self.assertEqual(result["长"], ["cháng", "zhǎng"])
+        src = _src(
+            json.dumps([
+                {"index": 1, "char": "中", "pinyin": ["zhōng", "zhòng"]},
+                {"index": 2, "char": "长", "pinyin": ["cháng", "zhǎng"]},
+            ], ensure_ascii=False),
+        )
+        result = _load_polyphone_candidates(src)
+        self.assertEqual(result["中"], ("zhōng", "zhòng"))
+        self.assertEqual(result["长"], ("cháng", "zhǎng"))
 
     def test_skip_invalid_entries(self) -> None:
         """Test that invalid entries are skipped."""
-        with tempfile.TemporaryDirectory() as td:
-            path = Path(td) / "polyphone.json"
-            path.write_text(
-                json.dumps([
-                    {"index": 1, "char": "中", "pinyin": ["zhōng", "zhòng"]},
-                    {"index": 2, "char": "长"},  # Missing pinyin
-                    "invalid entry",
-                ], ensure_ascii=False),
-                encoding="utf-8",
-            )
-            result = _load_polyphone_candidates(path)
-            self.assertIn("中", result)
-            self.assertNotIn("长", result)
+        src = _src(
+            json.dumps([
+                {"index": 1, "char": "中", "pinyin": ["zhōng", "zhòng"]},
+                {"index": 2, "char": "长"},  # Missing pinyin
+                "invalid entry",
+            ], ensure_ascii=False),
+        )
+        result = _load_polyphone_candidates(src)
+        self.assertIn("中", result)
+        self.assertNotIn("长", result)
 
     def test_non_array_input(self) -> None:
         """Test handling of non-array JSON input."""
-        with tempfile.TemporaryDirectory() as td:
-            path = Path(td) / "polyphone.json"
-            path.write_text(
-                json.dumps({"not": "an array"}),
-                encoding="utf-8",
-            )
-            result = _load_polyphone_candidates(path)
-            self.assertEqual(result, {})
+        src = _src(
+            json.dumps({"not": "an array"}),
+        )
+        result = _load_polyphone_candidates(src)
+        self.assertEqual(result, {})
 
 
 class TestLoadPolyphoneDisambig(unittest.TestCase):
     """Tests for _load_polyphone_disambig function."""
 
+    def test_invalid_json_raises_stdlib_error(self) -> None:
+        """Test a malformed whole-file resource raises json.JSONDecodeError whichever parser is used."""
+        src = _src('{"items": [')
+        with self.assertRaises(json.JSONDecodeError):
+            _load_polyphone_disambig(src)
+
     def test_load_valid(self) -> None:
         """Test loading valid disambiguation data."""
-        with tempfile.TemporaryDirectory() as td:
-            path = Path(td) / "polyphone_disambig.json"
-            path.write_text(
-                json.dumps({
-                    "schema": "test",
-                    "thresholds": {"min_support": 5, "min_prob": 0.85},
-                    "items": [
-                        {"char": "中", "candidates": ["zhōng", "zhòng"], "default": "zhōng"},
-                        {"char": "长", "candidates": ["cháng", "zhǎng"], "default": "cháng"},
-                    ],
-                }, ensure_ascii=False),
-                encoding="utf-8",
-            )
-            by_char, thresholds = _load_polyphone_disambig(path)
-            self.assertIn("中", by_char)
-            self.assertIn("长", by_char)
-            self.assertEqual(thresholds["min_support"], 5)
-            self.assertEqual(thresholds["min_prob"], 0.85)
+        src = _src(
+            json.dumps({
+                "schema": "test",
+                "thresholds": {"min_support": 5, "min_prob": 0.85},
+                "items": [
+                    {"char": "中", "candidates": ["zhōng", "zhòng"], "default": "zhōng"},
+                    {"char": "长", "candidates": ["cháng", "zhǎng"], "default": "cháng"},
+                ],
+            }, ensure_ascii=False),
+        )
+        by_char, thresholds = _load_polyphone_disambig(src)
+        self.assertIn("中", by_char)
+        self.assertIn("长", by_char)
+        self.assertEqual(thresholds["min_support"], 5)
+        self.assertEqual(thresholds["min_prob"], 0.85)
 
     def test_default_thresholds(self) -> None:
         """Test that default thresholds are used when not specified."""
-        with tempfile.TemporaryDirectory() as td:
-            path = Path(td) / "polyphone_disambig.json"
-            path.write_text(
-                json.dumps({
-                    "items": [],
-                }, ensure_ascii=False),
-                encoding="utf-8",
-            )
-            by_char, thresholds = _load_polyphone_disambig(path)
-            self.assertEqual(by_char, {})
-            self.assertIsInstance(thresholds, dict)
+        src = _src(
+            json.dumps({
+                "items": [],
+            }, ensure_ascii=False),
+        )
+        by_char, thresholds = _load_polyphone_disambig(src)
+        self.assertEqual(by_char, {})
+        self.assertIsInstance(thresholds, dict)
 
     def test_invalid_thresholds_type(self) -> None:
         """Test handling of invalid thresholds type."""
-        with tempfile.TemporaryDirectory() as td:
-            path = Path(td) / "polyphone_disambig.json"
-            path.write_text(
-                json.dumps({
-                    "thresholds": "invalid",
-                    "items": [],
-                }, ensure_ascii=False),
-                encoding="utf-8",
-            )
-            by_char, thresholds = _load_polyphone_disambig(path)
-            self.assertIsInstance(thresholds, dict)
+        src = _src(
+            json.dumps({
+                "thresholds": "invalid",
+                "items": [],
+            }, ensure_ascii=False),
+        )
+        by_char, thresholds = _load_polyphone_disambig(src)
+        self.assertIsInstance(thresholds, dict)
 
 
 class TestLoadOverridesRules(unittest.TestCase):
@@ -229,21 +230,18 @@ class TestLoadOverridesRules(unittest.TestCase):
 
     def test_load_existing_file(self) -> None:
         """Test loading existing overrides file."""
-        with tempfile.TemporaryDirectory() as td:
-            path = Path(td) / "overrides.json"
-            path.write_text(
-                json.dumps({
-                    "schema_version": 1,
-                    "rules": [
-                        {"id": "rule1", "priority": 100},
-                        {"id": "rule2", "priority": 50},
-                    ],
-                }, ensure_ascii=False),
-                encoding="utf-8",
-            )
-            result = _load_overrides_rules(path)
-            self.assertEqual(len(result), 2)
-            self.assertEqual(result[0]["id"], "rule1")
+        src = _src(
+            json.dumps({
+                "schema_version": 1,
+                "rules": [
+                    {"id": "rule1", "priority": 100},
+                    {"id": "rule2", "priority": 50},
+                ],
+            }, ensure_ascii=False),
+        )
+        result = _load_overrides_rules(src)
+        self.assertEqual(len(result), 2)
+        self.assertEqual(result[0]["id"], "rule1")
 
     def test_create_missing_file(self) -> None:
         """Test creating overrides file when missing."""
@@ -260,17 +258,14 @@ class TestLoadOverridesRules(unittest.TestCase):
 
     def test_non_array_rules(self) -> None:
         """Test handling of non-array rules field."""
-        with tempfile.TemporaryDirectory() as td:
-            path = Path(td) / "overrides.json"
-            path.write_text(
-                json.dumps({
-                    "schema_version": 1,
-                    "rules": "not an array",
-                }, ensure_ascii=False),
-                encoding="utf-8",
-            )
-            result = _load_overrides_rules(path)
-            self.assertEqual(result, [])
+        src = _src(
+            json.dumps({
+                "schema_version": 1,
+                "rules": "not an array",
+            }, ensure_ascii=False),
+        )
+        result = _load_overrides_rules(src)
+        self.assertEqual(result, [])
 
 
 class TestLoadLexicon(unittest.TestCase):
@@ -278,54 +273,45 @@ class TestLoadLexicon(unittest.TestCase):
 
     def test_load_with_items_field(self) -> None:
         """Test loading lexicon with items field."""
-        with tempfile.TemporaryDirectory() as td:
-            path = Path(td) / "lexicon.json"
-            path.write_text(
-                json.dumps({
-                    "schema_version": 1,
-                    "items": [
-                        {"word": "银行", "pinyin": "yín háng"},
-                        {"word": "中国", "pinyin": "zhōng guó"},
-                    ],
-                }, ensure_ascii=False),
-                encoding="utf-8",
-            )
-            result = _load_lexicon(path)
-            self.assertEqual(result["银行"], "yín háng")
-            self.assertEqual(result["中国"], "zhōng guó")
+        src = _src(
+            json.dumps({
+                "schema_version": 1,
+                "items": [
+                    {"word": "银行", "pinyin": "yín háng"},
+                    {"word": "中国", "pinyin": "zhōng guó"},
+                ],
+            }, ensure_ascii=False),
+        )
+        result = _load_lexicon(src)
+        self.assertEqual(result["银行"], "yín háng")
+        self.assertEqual(result["中国"], "zhōng guó")
 
     def test_load_simple_dict(self) -> None:
         """Test loading simple dict format."""
-        with tempfile.TemporaryDirectory() as td:
-            path = Path(td) / "lexicon.json"
-            path.write_text(
-                json.dumps({
-                    "银行": "yín háng",
-                    "中国": "zhōng guó",
-                }, ensure_ascii=False),
-                encoding="utf-8",
-            )
-            result = _load_lexicon(path)
-            self.assertEqual(result["银行"], "yín háng")
-            self.assertEqual(result["中国"], "zhōng guó")
+        src = _src(
+            json.dumps({
+                "银行": "yín háng",
+                "中国": "zhōng guó",
+            }, ensure_ascii=False),
+        )
+        result = _load_lexicon(src)
+        self.assertEqual(result["银行"], "yín háng")
+        self.assertEqual(result["中国"], "zhōng guó")
 
     def test_skip_non_han_words(self) -> None:
         """Test that words with non-Han characters are skipped."""
-        with tempfile.TemporaryDirectory() as td:
-            path = Path(td) / "lexicon.json"
-            path.write_text(
-                json.dumps({
-                    "schema_version": 1,
-                    "items": [
-                        {"word": "银行", "pinyin": "yín háng"},
-                        {"word": "OpenAI", "pinyin": "OpenAI"},  # Should be skipped
-                    ],
-                }, ensure_ascii=False),
-                encoding="utf-8",
-            )
-            result = _load_lexicon(path)
-            self.assertIn("银行", result)
-            self.assertNotIn("OpenAI", result)
+        src = _src(
+            json.dumps({
+                "schema_version": 1,
+                "items": [
+                    {"word": "银行", "pinyin": "yín háng"},
+                    {"word": "OpenAI", "pinyin": "OpenAI"},  # Should be skipped
+                ],
+            }, ensure_ascii=False),
+        )
+        result = _load_lexicon(src)
+        self.assertIn("银行", result)
+        self.assertNotIn("OpenAI", result)
 
     def test_missing_file(self) -> None:
         """Test handling of missing file."""
@@ -406,6 +392,16 @@ class TestPinyinResources(unittest.TestCase):
             self.assertIn("中国", combined)
             self.assertEqual(combined["银行"], "yín háng")
             self.assertEqual(combined["中国"], "zhōng guó")
+            self.assertIs(resources.combined_word_pinyin(), combined)
+            with self.assertRaises(TypeError):
+                combined["中国"] = "x"  # type: ignore[index]
+
+            lengths = resources.max_len_by_first_char()
+            self.assertEqual(lengths["银"], 2)
+            self.assertEqual(lengths["中"], 2)
+            self.assertIs(resources.max_len_by_first_char(), lengths)
+            with self.assertRaises(TypeError):
+                lengths["中"] = 9  # type: ignore[index]
 
     def test_lexicon_overrides_word(self) -> None:
         """Test that lexicon entries override word entries."""
@@ -427,6 +423,98 @@ class TestPinyinResources(unittest.TestCase):
 
             self.assertEqual(combined["银行"], "different")
 
+    def test_load_from_mapping(self) -> None:
+        """Test in-memory file contents load like the same files on disk."""
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            self._create_test_files(root)
+            files = {p.name: p.read_bytes() for p in root.iterdir()}
+            from_dir = PinyinResources.load_from_dir(root)
+
+        self.assertEqual(PinyinResources.load_from_mapping(files), from_dir)
+        del files["lexicon.json"], files["overrides.json"]
+        minimal = PinyinResources.load_from_mapping(files)
+        self.assertEqual(minimal.lexicon_pinyin, {})
+        self.assertEqual(minimal.overrides_rules, [])
+
+    def test_compiled_round_trip(self) -> None:
+        """Test save_compiled/load_compiled reproduce the JSON-loaded resources."""
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            self._create_test_files(root)
+            resources = PinyinResources.load_from_dir(root)
+            path = root / "resources.json"
+
+            resources.save_compiled(path)
+            self.assertEqual(PinyinResources.load_compiled(path), resources)
+
+            header = {"format": "pinyinize-resources", "version": _CACHE_VERSION, "stamp": []}
+            for bad in (
+                json.dumps({**header, "format": "other", "data": {}}).encode(),
+                json.dumps({**header, "data": {}}).encode(),
+                pickle.dumps(("other", resources)),
+            ):
+                path.write_bytes(bad)
+                with self.assertRaises(ValueError):
+                    PinyinResources.load_compiled(path)
+
+    def test_load_from_cache(self) -> None:
+        """Test the compiled cache round-trips and is rebuilt when a source file changes."""
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            self._create_test_files(root)
+            cache = root / "resources.cache"
+
+            first = PinyinResources.load_from_cache(root, cache)
+            self.assertTrue(cache.exists())
+            self.assertEqual(first, PinyinResources.load_from_dir(root))
+            self.assertEqual(PinyinResources.load_from_cache(root, cache), first)
+
+            root.joinpath("lexicon.json").write_text(
+                json.dumps({
+                    "schema_version": 1,
+                    "items": [{"word": "中国", "pinyin": "zhōng guó"}],
+                }, ensure_ascii=False) + "\n",
+                encoding="utf-8",
+            )
+            rebuilt = PinyinResources.load_from_cache(root, cache)
+            self.assertEqual(rebuilt.lexicon_pinyin, {"中国": "zhōng guó"})
+
+    def test_load_from_cache_unreadable(self) -> None:
+        """Test a corrupt cache file is replaced instead of raising."""
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            self._create_test_files(root)
+            cache = root / "resources.cache"
+            cache.write_bytes(b"not a compiled file")
+
+            resources = PinyinResources.load_from_cache(root, cache)
+            self.assertIn("银行", resources.word_pinyin)
+            self.assertEqual(PinyinResources.load_from_cache(root, cache), resources)
+
+    def test_load_from_cache_does_not_unpickle(self) -> None:
+        """Test a pickle planted at the cache path is never deserialized."""
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            self._create_test_files(root)
+            cache = root / "resources.cache"
+            cache.write_bytes(pickle.dumps(_Tripwire()))
+
+            resources = PinyinResources.load_from_cache(root, cache)
+            self.assertIn("银行", resources.word_pinyin)
+            self.assertFalse(_Tripwire.fired)
+
+
+class _Tripwire:
+    fired = False
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (_Tripwire._fire, ())
+
+    @staticmethod
+    def _fire() -> None:
+        _Tripwire.fired = True
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,9 +2,21 @@
 
 from __future__ import annotations
 
+import re
+import sys
 import unittest
 
-from pinyinize.rules import AppliedRule, _match_part, rule_matches, sort_rules
+from pinyinize.rules import (
+    AppliedRule,
+    RuleSet,
+    _match_part,
+    build_rule_index,
+    compile_match,
+    compile_part,
+    match_part_batch,
+    rule_matches,
+    sort_rules,
+)
 from pinyinize.types import Token
 
 
@@ -47,6 +59,13 @@ class TestMatchPart(unittest.TestCase):
         tok = Token(span_id="S0", index_in_span=0, start=0, end=2, text="学校")
         self.assertFalse(_match_part(part, tok))
 
+    def test_match_precompiled_regex(self) -> None:
+        """Test a compiled pattern is accepted as well as a pattern string."""
+        part = {"regex": re.compile(r"^银.+")}
+        tok = Token(span_id="S0", index_in_span=0, start=0, end=2, text="银行")
+        self.assertTrue(_match_part(part, tok))
+        self.assertFalse(_match_part(part, Token(span_id="S0", index_in_span=0, start=0, end=2, text="学校")))
+
     def test_match_upos_in(self) -> None:
         """Test upos_in match."""
         part = {"upos_in": ["NOUN", "PROPN"]}
@@ -125,6 +144,68 @@ class TestMatchPart(unittest.TestCase):
         self.assertTrue(_match_part(part, tok))
 
 
+class TestMatchPartBatch(unittest.TestCase):
+    """Tests for compile_part and match_part_batch."""
+
+    def _tokens(self) -> list[Token]:
+        rows = [("在", "ADP"), ("银行", "NOUN"), ("行长", "NOUN"), ("行", "VERB"), ("学校", "NOUN")]
+        return [
+            Token(span_id="S0", index_in_span=i, start=i, end=i + 1, text=text, upos=upos)
+            for i, (text, upos) in enumerate(rows)
+        ]
+
+    def test_batch_agrees_with_match_part(self) -> None:
+        """Test every criterion gives the same answer per position as _match_part."""
+        tokens = self._tokens()
+        parts = [
+            {},
+            {"text": "银行"},
+            {"text_in": ["银行", "学校"]},
+            {"regex": "^行"},
+            {"upos_in": ["NOUN"], "contains": ["行"]},
+            {"xpos_in": ["UNK"], "ner_in": ["PER"]},
+            {"text": 5},
+            {"text_in": "银行", "contains": "行"},
+        ]
+        for part in parts:
+            expected = [_match_part(part, tok) for tok in tokens]
+            self.assertEqual(match_part_batch(part, tokens), expected, part)
+            compiled = compile_part(part)
+            self.assertEqual(match_part_batch(compiled, tokens), expected, part)
+            self.assertEqual([compiled.matches(tok) for tok in tokens], expected, part)
+
+    def test_literals_interned(self) -> None:
+        """Test compiled literal texts are the interned string objects."""
+        compiled = compile_part({"text": "".join(["银", "行"]), "text_in": ["".join(["学", "校"])]})
+        self.assertIs(compiled.text, sys.intern("银行"))
+        self.assertIs(next(iter(compiled.text_in or ())), sys.intern("学校"))
+
+    def test_literal_regex_skips_engine(self) -> None:
+        """Test anchored literal patterns become string tests that agree with re.search."""
+        texts = ["银行", "银行\n", "学校", "行", "", "银"]
+        for pattern, fields in [
+            ("^银行$", {"text_in": frozenset({"银行", "银行\n"})}),
+            ("^(?:银行|学校)$", {"text_in": frozenset({"银行", "银行\n", "学校", "学校\n"})}),
+            ("^银", {"prefix": "银"}),
+            ("行$", {"suffixes": ("行", "行\n")}),
+            ("行", {"contains": ("行",)}),
+        ]:
+            compiled = compile_part({"regex": pattern})
+            self.assertIsNone(compiled.regex, pattern)
+            for name, value in fields.items():
+                self.assertEqual(getattr(compiled, name), value, pattern)
+            for text in texts:
+                tok = Token(span_id="S0", index_in_span=0, start=0, end=1, text=text)
+                self.assertEqual(compiled.matches(tok), bool(re.search(pattern, text)), (pattern, text))
+
+        self.assertIsNotNone(compile_part({"regex": "^银.+"}).regex)
+        self.assertIsNotNone(compile_part({"regex": "(?:银行|学校)"}).regex)
+
+    def test_empty_sentence(self) -> None:
+        """Test an empty token list gives an empty result."""
+        self.assertEqual(match_part_batch({"text": "银行"}, []), [])
+
+
 class TestRuleMatches(unittest.TestCase):
     """Tests for rule_matches function."""
 
@@ -249,6 +330,60 @@ class TestRuleMatches(unittest.TestCase):
         self.assertFalse(rule_matches(rule, tok, None, None))
 
 
+class TestCompileMatch(unittest.TestCase):
+    """Tests for compile_match function."""
+
+    def test_agrees_with_rule_matches(self) -> None:
+        """Test compiled matches give the rule_matches answer, including malformed rules."""
+        prev = Token(span_id="S0", index_in_span=0, start=0, end=1, text="在", upos="ADP")
+        tok = Token(span_id="S0", index_in_span=1, start=1, end=3, text="银行", upos="NOUN")
+        nxt = Token(span_id="S0", index_in_span=2, start=3, end=4, text="行", upos="VERB")
+        rules = [
+            {"id": "r"},
+            {"id": "r", "match": {"self": {"text": "银行"}}},
+            {"id": "r", "match": {"self": {"text_in": ["学校"]}}},
+            {"id": "r", "match": {"self": {"contains": ["行"]}, "prev": {"upos_in": ["ADP"]}}},
+            {"id": "r", "match": {"next": {"text": "行"}}},
+            {"id": "r", "match": {"prev": {"regex": "^在$"}, "next": {"upos_in": ["NOUN"]}}},
+            {"id": "r", "match": "bad"},
+            {"id": "r", "match": {"self": "bad"}},
+            {"id": "r", "match": {"prev": []}},
+        ]
+        for rule in rules:
+            compiled = compile_match(rule)  # type: ignore[arg-type]
+            for p, n in [(prev, nxt), (None, nxt), (prev, None), (None, None)]:
+                self.assertEqual(
+                    compiled.matches(tok, p, n),
+                    rule_matches(rule, tok, p, n),  # type: ignore[arg-type]
+                    (rule, p, n),
+                )
+
+    def test_match_batch(self) -> None:
+        """Test match_batch equals matches with each position's neighbours."""
+        tokens = [
+            Token(span_id="S0", index_in_span=i, start=i, end=i + 1, text=text, upos=upos)
+            for i, (text, upos) in enumerate([("在", "ADP"), ("银行", "NOUN"), ("行", "VERB"), ("银行", "NOUN")])
+        ]
+        rules = [
+            {"id": "r"},
+            {"id": "r", "match": {"self": {"text": "银行"}, "prev": {"upos_in": ["ADP"]}}},
+            {"id": "r", "match": {"self": {"contains": ["行"]}, "next": {"text": "行"}}},
+            {"id": "r", "match": {"prev": {"text": "行"}, "next": {"text": "行"}}},
+        ]
+        for rule in rules:
+            compiled = compile_match(rule)  # type: ignore[arg-type]
+            expected = [
+                compiled.matches(
+                    tok,
+                    tokens[i - 1] if i > 0 else None,
+                    tokens[i + 1] if i + 1 < len(tokens) else None,
+                )
+                for i, tok in enumerate(tokens)
+            ]
+            self.assertEqual(compiled.match_batch(tokens), expected, rule)
+            self.assertEqual(compiled.match_batch([]), [])
+
+
 class TestSortRules(unittest.TestCase):
     """Tests for sort_rules function."""
 
@@ -302,6 +437,36 @@ class TestSortRules(unittest.TestCase):
         self.assertEqual(sort_rules([]), [])
 
 
+class TestBuildRuleIndex(unittest.TestCase):
+    """Tests for build_rule_index function."""
+
+    def test_index_by_literal_text(self) -> None:
+        """Test rules are keyed by self.text / self.text_in, others are residual."""
+        r_text = {"id": "a", "match": {"self": {"text": "银行"}}}
+        r_in = {"id": "b", "match": {"self": {"text_in": ["银行", "支行", "银行"]}}}
+        r_regex = {"id": "c", "match": {"self": {"regex": "^银"}}}
+        r_prev = {"id": "d", "match": {"prev": {"text": "在"}}}
+        by_text, residual = build_rule_index([r_text, r_in, r_regex, r_prev])
+
+        self.assertEqual(by_text, {"银行": [r_text, r_in], "支行": [r_in]})
+        self.assertEqual(residual, [r_regex, r_prev])
+
+
+class TestRuleSet(unittest.TestCase):
+    """Tests for RuleSet.build."""
+
+    def test_build(self) -> None:
+        """Test rules are sorted and indexed once, and rules without a string id are dropped."""
+        low = {"id": "low", "priority": 1, "match": {"self": {"text": "银行"}}}
+        high = {"id": "high", "priority": 9, "match": {"prev": {"text": "在"}}}
+        rules = RuleSet.build([low, {"priority": 5}, {"id": 3}, "bad", high])
+
+        self.assertEqual(rules.ordered, (high, low))
+        self.assertEqual(rules.by_text, {"银行": (low,)})
+        self.assertEqual(rules.residual, (high,))
+        self.assertEqual(rules.matchers, (compile_match(high), compile_match(low)))
+
+
 class TestAppliedRule(unittest.TestCase):
     """Tests for AppliedRule dataclass."""
 